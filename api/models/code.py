@@ -4,9 +4,12 @@ Supports 50+ programming languages with intelligent analysis
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Tuple, Mapping
+from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
+import sys
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -415,3 +418,81 @@ class LanguageConfig(BaseModel):
     comment_syntax: Dict[str, str] = {}  # single, multi
     string_syntax: List[str] = []
     related_languages: List[str] = []
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class LanguageConfigLite:
+    """
+    Immutable, slotted view of a LanguageConfig for the static language table.
+    There is one instance per language, so equality and hashing are by
+    identity (eq=False) and a config can key identity-based caches.
+    """
+    name: str
+    display_name: str
+    file_extensions: Tuple[str, ...]
+    paradigms: Tuple[LanguageParadigm, ...]
+    typing: str
+    compiled: bool
+    interpreted: bool
+    garbage_collected: bool
+    memory_safe: bool
+    year_created: int
+    creator: str
+    description: str
+    use_cases: Tuple[str, ...]
+    popular_frameworks: Tuple[str, ...]
+    package_manager: Optional[str]
+    documentation_url: Optional[str]
+    syntax_example: str
+    hello_world: str
+    keywords: Tuple[str, ...]
+    operators: Tuple[str, ...]
+    comment_syntax: Mapping[str, str]  # read-only view
+    string_syntax: Tuple[str, ...]
+    related_languages: Tuple[str, ...]
+
+    @classmethod
+    def from_config(
+        cls, config: LanguageConfig, shared: Optional[Dict[Any, Any]] = None
+    ) -> "LanguageConfigLite":
+        """
+        Convert a LanguageConfig, interning its short strings. Operator and
+        string-syntax tuples and comment-syntax views equal to ones already in
+        `shared` (kept by the caller across conversions) reuse those objects.
+        """
+        if shared is None:
+            shared = {}
+
+        def shared_strings(values: List[str]) -> Tuple[str, ...]:
+            interned = tuple(sys.intern(value) for value in values)
+            return shared.setdefault(interned, interned)
+
+        comment_pairs = frozenset(
+            (sys.intern(k), sys.intern(v)) for k, v in config.comment_syntax.items()
+        )
+        comment_syntax = shared.setdefault(comment_pairs, MappingProxyType(dict(comment_pairs)))
+        return cls(
+            name=sys.intern(config.name),
+            display_name=config.display_name,
+            file_extensions=tuple(config.file_extensions),
+            paradigms=tuple(config.paradigms),
+            typing=sys.intern(config.typing),
+            compiled=config.compiled,
+            interpreted=config.interpreted,
+            garbage_collected=config.garbage_collected,
+            memory_safe=config.memory_safe,
+            year_created=config.year_created,
+            creator=config.creator,
+            description=config.description,
+            use_cases=tuple(config.use_cases),
+            popular_frameworks=tuple(config.popular_frameworks),
+            package_manager=sys.intern(config.package_manager) if config.package_manager else None,
+            documentation_url=config.documentation_url,
+            syntax_example=config.syntax_example,
+            hello_world=config.hello_world,
+            keywords=tuple(sys.intern(keyword) for keyword in config.keywords),
+            operators=shared_strings(config.operators),
+            comment_syntax=comment_syntax,
+            string_syntax=shared_strings(config.string_syntax),
+            related_languages=tuple(config.related_languages),
+        )
@@ -24,7 +24,8 @@ Tile Values & Meanings:
 - 4096+: Transcendence (creating new knowledge)
 """
 
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
+from pydantic import BaseModel, Field, PrivateAttr
 from typing import Optional, List, Dict, Any, Tuple
 from enum import Enum
 from datetime import datetime
@@ -160,6 +161,67 @@ class MemoryTile(BaseModel):
         return colors.get(self.value, "#3c3a32")
 
 
+@dataclass(slots=True)
+class _Occupancy:
+    """
+    Which tile sits in which cell of a grid, and which cells are free.
+    A plain object rather than separate private attributes: pydantic routes
+    every private attribute read through __getattr__, which dominated move
+    time when done per cell.
+
+    Free cells live in a list (for O(1) random picks) with a position -> slot
+    map (for O(1) swap-with-last removal). Tiles merged away during a move are
+    collected in `absorbed` and dropped from the grid's tile list in one pass.
+    """
+    at: Dict[Tuple[int, int], MemoryTile]
+    free: List[Tuple[int, int]]
+    free_slot: Dict[Tuple[int, int], int]
+    absorbed: List[MemoryTile] = field(default_factory=list)
+
+    @classmethod
+    def build(cls, tiles: List[MemoryTile], size: int) -> "_Occupancy":
+        at = {tile.position: tile for tile in tiles}
+        free = [(r, c) for r in range(size) for c in range(size) if (r, c) not in at]
+        return cls(at, free, {cell: i for i, cell in enumerate(free)})
+
+    def free_cell(self, position: Tuple[int, int]) -> None:
+        """Mark a cell as empty"""
+        if position not in self.free_slot:
+            self.free_slot[position] = len(self.free)
+            self.free.append(position)
+
+    def take_cell(self, position: Tuple[int, int]) -> None:
+        """Mark a cell as occupied"""
+        slot = self.free_slot.pop(position, None)
+        if slot is None:
+            return
+        last = self.free.pop()
+        if slot < len(self.free):
+            self.free[slot] = last
+            self.free_slot[last] = slot
+
+    def place(self, tile: MemoryTile) -> None:
+        """Record a new tile at its position"""
+        self.at[tile.position] = tile
+        self.take_cell(tile.position)
+
+    def move(self, tile: MemoryTile, position: Tuple[int, int]) -> None:
+        """Move a tile to a new cell"""
+        if self.at.get(tile.position) is tile:
+            del self.at[tile.position]
+            self.free_cell(tile.position)
+        self.at[position] = tile
+        self.take_cell(position)
+        tile.position = position
+
+    def remove(self, tile: MemoryTile) -> None:
+        """Take a merged-away tile off the board"""
+        self.absorbed.append(tile)
+        if self.at.get(tile.position) is tile:
+            del self.at[tile.position]
+            self.free_cell(tile.position)
+
+
 class MemoryGrid(BaseModel):
     """The 2048-style memory grid"""
     user_id: str
@@ -174,6 +236,21 @@ class MemoryGrid(BaseModel):
     game_over: bool = False
     won: bool = False  # True when 2048 tile is reached
 
+    # Cell bookkeeping, kept in step with `tiles` by the memory engine
+    _occupancy: "_Occupancy" = PrivateAttr()
+
+    def model_post_init(self, __context: Any) -> None:
+        self._occupancy = _Occupancy.build(self.tiles, self.size)
+
+    def _drop_absorbed(self) -> None:
+        """Remove the tiles merged away during this move from `tiles`"""
+        absorbed = self._occupancy.absorbed
+        if not absorbed:
+            return
+        gone = {tile.id for tile in absorbed}
+        self.tiles = [tile for tile in self.tiles if tile.id not in gone]
+        absorbed.clear()
+
     @property
     def grid_array(self) -> List[List[Optional[MemoryTile]]]:
         """Get the grid as a 2D array"""
@@ -186,14 +263,8 @@ class MemoryGrid(BaseModel):
 
     @property
     def empty_cells(self) -> List[Tuple[int, int]]:
-        """Get list of empty cell positions"""
-        occupied = {tile.position for tile in self.tiles}
-        empty = []
-        for r in range(self.size):
-            for c in range(self.size):
-                if (r, c) not in occupied:
-                    empty.append((r, c))
-        return empty
+        """Get list of empty cell positions, in row-major order"""
+        return sorted(self._occupancy.free)
 
     @property
     def is_full(self) -> bool:
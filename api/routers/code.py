@@ -86,7 +86,7 @@ async def get_language_details(language: ProgrammingLanguage):
         "hello_world": config.hello_world,
         "keywords": config.keywords,
         "operators": config.operators,
-        "comment_syntax": config.comment_syntax,
+        "comment_syntax": dict(config.comment_syntax),
         "string_syntax": config.string_syntax,
         "related_languages": config.related_languages,
     }
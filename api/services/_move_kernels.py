@@ -0,0 +1,32 @@
+"""
+Move kernels for the memory engine
+Pure functions over tile values, kept free of tile objects and grid state
+"""
+
+from functools import lru_cache
+from typing import Tuple
+
+
+@lru_cache(maxsize=4096)
+def line_plan(values: Tuple[int, ...]) -> Tuple[Tuple[int, int, bool], ...]:
+    """
+    Standard 2048 slide of one line of tile values (0 = empty) towards index 0.
+    Returns (source, target, absorbed) for each occupied cell, in order; an
+    absorbed tile merges into the tile already placed at target. Each tile
+    merges at most once per move, so [2, 2, 4] becomes [4, 4] rather than [8].
+    Plans depend only on the values, so they are memoized across rows and grids.
+    """
+    plan = []
+    target = -1
+    mergeable = 0  # value at target that may still absorb a tile, 0 once merged
+    for source, value in enumerate(values):
+        if not value:
+            continue
+        if value == mergeable:
+            plan.append((source, target, True))
+            mergeable = 0
+        else:
+            target += 1
+            plan.append((source, target, False))
+            mergeable = value
+    return tuple(plan)
@@ -5,16 +5,1015 @@ Multi-language code analysis, explanation, and solution generation
 
 import re
 import time
-from typing import List, Dict, Any, Optional, Tuple
+import hashlib
+import numpy as np
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Tuple, Mapping, Callable, Sequence, Iterator
 from datetime import datetime
 
 from models.code import (
     ProgrammingLanguage, LanguageParadigm, DifficultyLevel, ProblemCategory,
     CodeError, CodeMetrics, ExecutionStep, CodeAnalysisResponse,
-    SolutionApproach, CodeSolution, LanguageConfig,
+    SolutionApproach, CodeSolution, LanguageConfig, LanguageConfigLite,
 )
 
 
+# Analysis results are memoized per (language, code digest, flags); snippets
+# shorter than the minimum are cheaper to re-analyze than to hash and cache.
+# A cached response holds roughly 100x its source in memory, so sources over
+# the maximum are never cached and the cached sources together stay under the
+# total budget (oldest entries are evicted first).
+ANALYSIS_CACHE_SIZE = 1024
+ANALYSIS_CACHE_MIN_LENGTH = 256
+ANALYSIS_CACHE_MAX_LENGTH = 65_536
+ANALYSIS_CACHE_MAX_TOTAL_LENGTH = 524_288
+
+# Individual passes are also memoized per (pass, language, code digest), so
+# re-analyzing an unchanged buffer with different flags reuses earlier work.
+# Same length limits as the analysis cache; the budget counts each pass entry.
+PASS_CACHE_SIZE = 256
+PASS_CACHE_MAX_TOTAL_LENGTH = 524_288
+
+# ASCII sources at least this long are style-checked with NumPy; below it the
+# per-line Python loop is faster
+STYLE_VECTORIZE_MIN_LENGTH = 32_768
+
+# ASCII characters for which str.isspace() holds, other than the "\n" lines are split on
+_TRAILING_SPACE_BYTES = np.array(
+    [ord(" "), ord("\t"), ord("\r"), 0x0B, 0x0C, 0x1C, 0x1D, 0x1E, 0x1F], dtype=np.uint8
+)
+
+
+def _split_source_lines(code: str) -> List[str]:
+    """
+    Split on "\n" only, the same breaks _check_syntax counts, so every pass
+    agrees on line numbers (form feeds and other splitlines() breaks stay
+    inside their line). One trailing "\r" is dropped from each line so CRLF
+    endings don't read as trailing whitespace, and a final line break
+    doesn't open an empty line.
+    """
+    lines = code.split("\n")
+    if not lines[-1]:
+        lines.pop()
+    return [line[:-1] if line.endswith("\r") else line for line in lines]
+
+
+@dataclass(slots=True)
+class _ErrorRec:
+    """Issue record collected while scanning; converted to CodeError once per response"""
+    line: int
+    error_type: str
+    severity: str
+    message: str
+    suggestion: Optional[str] = None
+    code_snippet: Optional[str] = None
+
+    def to_model(self) -> CodeError:
+        # Fields were produced by the analyzer itself, so skip validation
+        return CodeError.model_construct(
+            line=self.line,
+            error_type=self.error_type,
+            severity=self.severity,
+            message=self.message,
+            suggestion=self.suggestion,
+            code_snippet=self.code_snippet,
+        )
+
+
+@dataclass(slots=True)
+class _StepRec:
+    """Trace step collected while scanning; converted to ExecutionStep once per response"""
+    step_number: int
+    line: int
+    operation: str
+    explanation: str
+
+    def to_model(self) -> ExecutionStep:
+        return ExecutionStep.model_construct(
+            step_number=self.step_number,
+            line=self.line,
+            operation=self.operation,
+            variables={},
+            output=None,
+            explanation=self.explanation,
+            visualization=None,
+        )
+
+
+def _explain_prefix(config: LanguageConfigLite) -> str:
+    """Static head of a language's code explanation; only the line counts vary per call"""
+    return (
+        f"This is {config.display_name} code.\n"
+        f"\n"
+        f"Language Info:\n"
+        f"- Paradigms: {', '.join(p.value for p in config.paradigms)}\n"
+        f"- Typing: {config.typing}\n"
+        f"- Memory managed: {'Yes (GC)' if config.garbage_collected else 'Manual'}\n"
+        f"\n"
+        f"Code Structure:\n"
+    )
+
+
+def _load_language_configs() -> Dict[str, LanguageConfig]:
+    """Load configuration for all supported languages"""
+    return {
+        # ─────────────────────────────────────────────────────────────
+        # WEB & FRONTEND LANGUAGES
+        # ─────────────────────────────────────────────────────────────
+        "javascript": LanguageConfig(
+            name="javascript",
+            display_name="JavaScript",
+            file_extensions=[".js", ".mjs", ".cjs"],
+            paradigms=[LanguageParadigm.OBJECT_ORIENTED, LanguageParadigm.FUNCTIONAL, LanguageParadigm.EVENT_DRIVEN],
+            typing="dynamic",
+            compiled=False,
+            interpreted=True,
+            garbage_collected=True,
+            memory_safe=True,
+            year_created=1995,
+            creator="Brendan Eich",
+            description="The language of the web. Used for frontend interactivity, backend (Node.js), and everywhere in between.",
+            use_cases=["Web Development", "Frontend", "Backend (Node.js)", "Mobile (React Native)", "Desktop (Electron)"],
+            popular_frameworks=["React", "Vue", "Angular", "Express", "Next.js", "Svelte"],
+            package_manager="npm",
+            documentation_url="https://developer.mozilla.org/en-US/docs/Web/JavaScript",
+            syntax_example="const greet = (name) => `Hello, ${name}!`;",
+            hello_world='console.log("Hello, World!");',
+            keywords=["const", "let", "var", "function", "class", "if", "else", "for", "while", "return", "async", "await", "import", "export"],
+            operators=["+", "-", "*", "/", "%", "**", "===", "!==", "&&", "||", "??", "?."],
+            comment_syntax={"single": "//", "multi_start": "/*", "multi_end": "*/"},
+            string_syntax=["'", '"', "`"],
+            related_languages=["TypeScript", "CoffeeScript", "Dart"],
+        ),
+        "typescript": LanguageConfig(
+            name="typescript",
+            display_name="TypeScript",
+            file_extensions=[".ts", ".tsx", ".mts"],
+            paradigms=[LanguageParadigm.OBJECT_ORIENTED, LanguageParadigm.FUNCTIONAL],
+            typing="static",
+            compiled=True,
+            interpreted=False,
+            garbage_collected=True,
+            memory_safe=True,
+            year_created=2012,
+            creator="Microsoft (Anders Hejlsberg)",
+            description="JavaScript with types. Adds static typing to JavaScript for better tooling and fewer runtime errors.",
+            use_cases=["Large-scale Web Apps", "Enterprise Software", "React/Angular/Vue Apps"],
+            popular_frameworks=["Angular", "NestJS", "Next.js", "Deno"],
+            package_manager="npm",
+            documentation_url="https://www.typescriptlang.org/docs/",
+            syntax_example="const greet = (name: string): string => `Hello, ${name}!`;",
+            hello_world='console.log("Hello, World!");',
+            keywords=["const", "let", "type", "interface", "class", "extends", "implements", "generic", "enum", "namespace"],
+            operators=["+", "-", "*", "/", "===", "as", "is", "keyof", "typeof"],
+            comment_syntax={"single": "//", "multi_start": "/*", "multi_end": "*/"},
+            string_syntax=["'", '"', "`"],
+            related_languages=["JavaScript", "C#", "Java"],
+        ),
+        "html": LanguageConfig(
+            name="html",
+            display_name="HTML",
+            file_extensions=[".html", ".htm"],
+            paradigms=[LanguageParadigm.DECLARATIVE],
+            typing="none",
+            compiled=False,
+            interpreted=True,
+            garbage_collected=False,
+            memory_safe=True,
+            year_created=1993,
+            creator="Tim Berners-Lee",
+            description="The standard markup language for creating web pages and web applications.",
+            use_cases=["Web Pages", "Email Templates", "Documentation"],
+            popular_frameworks=["None (markup language)"],
+            package_manager=None,
+            documentation_url="https://developer.mozilla.org/en-US/docs/Web/HTML",
+            syntax_example='<div class="container"><h1>Title</h1></div>',
+            hello_world="<html><body><h1>Hello, World!</h1></body></html>",
+            keywords=["html", "head", "body", "div", "span", "p", "a", "img", "script", "style"],
+            operators=[],
+            comment_syntax={"single": "<!-- -->", "multi_start": "<!--", "multi_end": "-->"},
+            string_syntax=['"', "'"],
+            related_languages=["CSS", "JavaScript", "XML"],
+        ),
+        "css": LanguageConfig(
+            name="css",
+            display_name="CSS",
+            file_extensions=[".css"],
+            paradigms=[LanguageParadigm.DECLARATIVE],
+            typing="none",
+            compiled=False,
+            interpreted=True,
+            garbage_collected=False,
+            memory_safe=True,
+            year_created=1996,
+            creator="Hakon Wium Lie",
+            description="Cascading Style Sheets for styling web pages.",
+            use_cases=["Web Styling", "Responsive Design", "Animations"],
+            popular_frameworks=["Tailwind", "Bootstrap", "Sass", "Less"],
+            package_manager=None,
+            documentation_url="https://developer.mozilla.org/en-US/docs/Web/CSS",
+            syntax_example=".container { display: flex; justify-content: center; }",
+            hello_world="body { font-family: sans-serif; }",
+            keywords=["display", "flex", "grid", "margin", "padding", "color", "background", "border", "position"],
+            operators=[":", ";", "{", "}", ","],
+            comment_syntax={"multi_start": "/*", "multi_end": "*/"},
+            string_syntax=['"', "'"],
+            related_languages=["Sass", "Less", "HTML"],
+        ),
+
+        # ─────────────────────────────────────────────────────────────
+        # BACKEND & SYSTEMS LANGUAGES
+        # ─────────────────────────────────────────────────────────────
+        "python": LanguageConfig(
+            name="python",
+            display_name="Python",
+            file_extensions=[".py", ".pyw", ".pyi"],
+            paradigms=[LanguageParadigm.OBJECT_ORIENTED, LanguageParadigm.FUNCTIONAL, LanguageParadigm.PROCEDURAL],
+            typing="dynamic",
+            compiled=False,
+            interpreted=True,
+            garbage_collected=True,
+            memory_safe=True,
+            year_created=1991,
+            creator="Guido van Rossum",
+            description="A versatile, readable language perfect for beginners and experts. Dominates in ML/AI, data science, and scripting.",
+            use_cases=["Machine Learning", "Data Science", "Web Development", "Automation", "Scientific Computing"],
+            popular_frameworks=["Django", "Flask", "FastAPI", "PyTorch", "TensorFlow", "Pandas", "NumPy"],
+            package_manager="pip",
+            documentation_url="https://docs.python.org/3/",
+            syntax_example='def greet(name: str) -> str:\n    return f"Hello, {name}!"',
+            hello_world='print("Hello, World!")',
+            keywords=["def", "class", "if", "elif", "else", "for", "while", "return", "import", "from", "try", "except", "with", "async", "await", "lambda"],
+            operators=["+", "-", "*", "/", "//", "%", "**", "==", "!=", "and", "or", "not", "in", "is"],
+            comment_syntax={"single": "#", "multi_start": '"""', "multi_end": '"""'},
+            string_syntax=["'", '"', "'''", '"""', "f'", 'f"'],
+            related_languages=["Ruby", "Julia", "Perl"],
+        ),
+        "java": LanguageConfig(
+            name="java",
+            display_name="Java",
+            file_extensions=[".java"],
+            paradigms=[LanguageParadigm.OBJECT_ORIENTED],
+            typing="static",
+            compiled=True,
+            interpreted=False,
+            garbage_collected=True,
+            memory_safe=True,
+            year_created=1995,
+            creator="James Gosling (Sun Microsystems)",
+            description="Write once, run anywhere. Enterprise-grade language powering Android, big data, and enterprise systems.",
+            use_cases=["Enterprise Software", "Android Development", "Big Data", "Web Services"],
+            popular_frameworks=["Spring", "Spring Boot", "Hibernate", "Android SDK", "Apache Kafka"],
+            package_manager="Maven/Gradle",
+            documentation_url="https://docs.oracle.com/en/java/",
+            syntax_example='public String greet(String name) {\n    return "Hello, " + name + "!";\n}',
+            hello_world='public class Main {\n    public static void main(String[] args) {\n        System.out.println("Hello, World!");\n    }\n}',
+            keywords=["public", "private", "protected", "class", "interface", "extends", "implements", "static", "final", "abstract", "void", "new", "return", "try", "catch"],
+            operators=["+", "-", "*", "/", "%", "==", "!=", "&&", "||", "!", "instanceof"],
+            comment_syntax={"single": "//", "multi_start": "/*", "multi_end": "*/"},
+            string_syntax=['"'],
+            related_languages=["Kotlin", "Scala", "C#"],
+        ),
+        "csharp": LanguageConfig(
+            name="csharp",
+            display_name="C#",
+            file_extensions=[".cs"],
+            paradigms=[LanguageParadigm.OBJECT_ORIENTED, LanguageParadigm.FUNCTIONAL],
+            typing="static",
+            compiled=True,
+            interpreted=False,
+            garbage_collected=True,
+            memory_safe=True,
+            year_created=2000,
+            creator="Microsoft (Anders Hejlsberg)",
+            description="Microsoft's flagship language. Powers Unity games, Windows apps, and enterprise backends.",
+            use_cases=["Game Development (Unity)", "Windows Apps", "Enterprise Software", "Web APIs"],
+            popular_frameworks=[".NET", "ASP.NET", "Unity", "Xamarin", "Blazor"],
+            package_manager="NuGet",
+            documentation_url="https://docs.microsoft.com/en-us/dotnet/csharp/",
+            syntax_example='public string Greet(string name) => $"Hello, {name}!";',
+            hello_world='Console.WriteLine("Hello, World!");',
+            keywords=["public", "private", "class", "interface", "struct", "async", "await", "var", "using", "namespace", "static", "void", "return"],
+            operators=["+", "-", "*", "/", "==", "!=", "&&", "||", "??", "?."],
+            comment_syntax={"single": "//", "multi_start": "/*", "multi_end": "*/"},
+            string_syntax=['"', "@", "$"],
+            related_languages=["Java", "F#", "TypeScript"],
+        ),
+        "cpp": LanguageConfig(
+            name="cpp",
+            display_name="C++",
+            file_extensions=[".cpp", ".cc", ".cxx", ".hpp", ".h"],
+            paradigms=[LanguageParadigm.OBJECT_ORIENTED, LanguageParadigm.PROCEDURAL, LanguageParadigm.FUNCTIONAL],
+            typing="static",
+            compiled=True,
+            interpreted=False,
+            garbage_collected=False,
+            memory_safe=False,
+            year_created=1985,
+            creator="Bjarne Stroustrup",
+            description="High-performance systems language. Powers game engines, browsers, and operating systems.",
+            use_cases=["Game Engines", "Systems Programming", "High-Frequency Trading", "Browsers", "Databases"],
+            popular_frameworks=["Qt", "Unreal Engine", "Boost", "POCO"],
+            package_manager="vcpkg/Conan",
+            documentation_url="https://en.cppreference.com/",
+            syntax_example='std::string greet(const std::string& name) {\n    return "Hello, " + name + "!";\n}',
+            hello_world='#include <iostream>\nint main() {\n    std::cout << "Hello, World!" << std::endl;\n    return 0;\n}',
+            keywords=["class", "struct", "public", "private", "virtual", "template", "typename", "const", "static", "new", "delete", "nullptr", "auto"],
+            operators=["+", "-", "*", "/", "++", "--", "->", "::", "<<", ">>", "==", "!="],
+            comment_syntax={"single": "//", "multi_start": "/*", "multi_end": "*/"},
+            string_syntax=['"'],
+            related_languages=["C", "Rust", "D"],
+        ),
+        "c": LanguageConfig(
+            name="c",
+            display_name="C",
+            file_extensions=[".c", ".h"],
+            paradigms=[LanguageParadigm.PROCEDURAL, LanguageParadigm.IMPERATIVE],
+            typing="static",
+            compiled=True,
+            interpreted=False,
+            garbage_collected=False,
+            memory_safe=False,
+            year_created=1972,
+            creator="Dennis Ritchie",
+            description="The mother of modern programming. Powers operating systems, embedded systems, and system utilities.",
+            use_cases=["Operating Systems", "Embedded Systems", "System Utilities", "Device Drivers"],
+            popular_frameworks=["None (systems language)"],
+            package_manager=None,
+            documentation_url="https://en.cppreference.com/w/c",
+            syntax_example='char* greet(const char* name) {\n    static char buffer[100];\n    sprintf(buffer, "Hello, %s!", name);\n    return buffer;\n}',
+            hello_world='#include <stdio.h>\nint main() {\n    printf("Hello, World!\\n");\n    return 0;\n}',
+            keywords=["int", "char", "float", "double", "void", "struct", "typedef", "enum", "const", "static", "extern", "if", "else", "for", "while", "return"],
+            operators=["+", "-", "*", "/", "%", "++", "--", "->", ".", "&", "*", "==", "!="],
+            comment_syntax={"single": "//", "multi_start": "/*", "multi_end": "*/"},
+            string_syntax=['"'],
+            related_languages=["C++", "Objective-C", "Rust"],
+        ),
+        "go": LanguageConfig(
+            name="go",
+            display_name="Go",
+            file_extensions=[".go"],
+            paradigms=[LanguageParadigm.PROCEDURAL, LanguageParadigm.CONCURRENT],
+            typing="static",
+            compiled=True,
+            interpreted=False,
+            garbage_collected=True,
+            memory_safe=True,
+            year_created=2009,
+            creator="Google (Rob Pike, Ken Thompson)",
+            description="Simple, fast, and concurrent. Perfect for cloud services, CLIs, and microservices.",
+            use_cases=["Cloud Services", "Microservices", "DevOps Tools", "CLI Applications"],
+            popular_frameworks=["Gin", "Echo", "Fiber", "Chi"],
+            package_manager="go mod",
+            documentation_url="https://golang.org/doc/",
+            syntax_example='func greet(name string) string {\n    return fmt.Sprintf("Hello, %s!", name)\n}',
+            hello_world='package main\n\nimport "fmt"\n\nfunc main() {\n    fmt.Println("Hello, World!")\n}',
+            keywords=["func", "package", "import", "var", "const", "type", "struct", "interface", "go", "chan", "select", "defer", "return"],
+            operators=["+", "-", "*", "/", ":=", "==", "!=", "<-", "..."],
+            comment_syntax={"single": "//", "multi_start": "/*", "multi_end": "*/"},
+            string_syntax=['"', "`"],
+            related_languages=["Rust", "C", "Python"],
+        ),
+        "rust": LanguageConfig(
+            name="rust",
+            display_name="Rust",
+            file_extensions=[".rs"],
+            paradigms=[LanguageParadigm.FUNCTIONAL, LanguageParadigm.IMPERATIVE, LanguageParadigm.CONCURRENT],
+            typing="static",
+            compiled=True,
+            interpreted=False,
+            garbage_collected=False,
+            memory_safe=True,
+            year_created=2010,
+            creator="Mozilla (Graydon Hoare)",
+            description="Memory-safe systems programming without garbage collection. Blazingly fast with zero-cost abstractions.",
+            use_cases=["Systems Programming", "WebAssembly", "CLI Tools", "Blockchain", "Game Engines"],
+            popular_frameworks=["Tokio", "Actix", "Rocket", "Axum", "Bevy"],
+            package_manager="Cargo",
+            documentation_url="https://doc.rust-lang.org/",
+            syntax_example='fn greet(name: &str) -> String {\n    format!("Hello, {}!", name)\n}',
+            hello_world='fn main() {\n    println!("Hello, World!");\n}',
+            keywords=["fn", "let", "mut", "const", "struct", "enum", "impl", "trait", "pub", "mod", "use", "match", "if", "loop", "async", "await"],
+            operators=["+", "-", "*", "/", "==", "!=", "&&", "||", "?", "=>", "->", "::"],
+            comment_syntax={"single": "//", "multi_start": "/*", "multi_end": "*/"},
+            string_syntax=['"', "r#"],
+            related_languages=["C++", "Haskell", "OCaml"],
+        ),
+        "kotlin": LanguageConfig(
+            name="kotlin",
+            display_name="Kotlin",
+            file_extensions=[".kt", ".kts"],
+            paradigms=[LanguageParadigm.OBJECT_ORIENTED, LanguageParadigm.FUNCTIONAL],
+            typing="static",
+            compiled=True,
+            interpreted=False,
+            garbage_collected=True,
+            memory_safe=True,
+            year_created=2011,
+            creator="JetBrains",
+            description="Modern alternative to Java. Now the preferred language for Android development.",
+            use_cases=["Android Development", "Backend Services", "Multiplatform Apps"],
+            popular_frameworks=["Ktor", "Spring Boot", "Android Jetpack", "Compose"],
+            package_manager="Gradle",
+            documentation_url="https://kotlinlang.org/docs/",
+            syntax_example='fun greet(name: String): String = "Hello, $name!"',
+            hello_world='fun main() {\n    println("Hello, World!")\n}',
+            keywords=["fun", "val", "var", "class", "object", "interface", "data", "sealed", "when", "if", "else", "return", "suspend"],
+            operators=["+", "-", "*", "/", "==", "!=", "?:", "?."],
+            comment_syntax={"single": "//", "multi_start": "/*", "multi_end": "*/"},
+            string_syntax=['"', '"""'],
+            related_languages=["Java", "Scala", "Swift"],
+        ),
+        "ruby": LanguageConfig(
+            name="ruby",
+            display_name="Ruby",
+            file_extensions=[".rb", ".rake"],
+            paradigms=[LanguageParadigm.OBJECT_ORIENTED, LanguageParadigm.FUNCTIONAL],
+            typing="dynamic",
+            compiled=False,
+            interpreted=True,
+            garbage_collected=True,
+            memory_safe=True,
+            year_created=1995,
+            creator="Yukihiro Matsumoto",
+            description="A programmer's best friend. Elegant syntax designed for developer happiness.",
+            use_cases=["Web Development", "Scripting", "DevOps", "Prototyping"],
+            popular_frameworks=["Ruby on Rails", "Sinatra", "Hanami"],
+            package_manager="RubyGems/Bundler",
+            documentation_url="https://ruby-doc.org/",
+            syntax_example='def greet(name)\n  "Hello, #{name}!"\nend',
+            hello_world='puts "Hello, World!"',
+            keywords=["def", "class", "module", "if", "else", "elsif", "unless", "case", "when", "do", "end", "return", "yield", "attr_accessor"],
+            operators=["+", "-", "*", "/", "==", "!=", "&&", "||", "<<", "=>"],
+            comment_syntax={"single": "#", "multi_start": "=begin", "multi_end": "=end"},
+            string_syntax=["'", '"', "%q", "%Q"],
+            related_languages=["Python", "Perl", "Crystal"],
+        ),
+        "php": LanguageConfig(
+            name="php",
+            display_name="PHP",
+            file_extensions=[".php", ".phtml"],
+            paradigms=[LanguageParadigm.OBJECT_ORIENTED, LanguageParadigm.PROCEDURAL],
+            typing="dynamic",
+            compiled=False,
+            interpreted=True,
+            garbage_collected=True,
+            memory_safe=True,
+            year_created=1995,
+            creator="Rasmus Lerdorf",
+            description="The language that powers most of the web. From WordPress to Facebook.",
+            use_cases=["Web Development", "CMS", "E-commerce", "APIs"],
+            popular_frameworks=["Laravel", "Symfony", "WordPress", "Drupal"],
+            package_manager="Composer",
+            documentation_url="https://www.php.net/docs.php",
+            syntax_example='function greet(string $name): string {\n    return "Hello, {$name}!";\n}',
+            hello_world='<?php\necho "Hello, World!";',
+            keywords=["function", "class", "public", "private", "protected", "interface", "trait", "namespace", "use", "return", "if", "else", "foreach", "while"],
+            operators=["+", "-", "*", "/", ".", "==", "===", "!=", "!==", "&&", "||", "??", "?->"],
+            comment_syntax={"single": "//", "multi_start": "/*", "multi_end": "*/"},
+            string_syntax=["'", '"'],
+            related_languages=["JavaScript", "Python", "Perl"],
+        ),
+
+        # ─────────────────────────────────────────────────────────────
+        # MOBILE LANGUAGES
+        # ─────────────────────────────────────────────────────────────
+        "swift": LanguageConfig(
+            name="swift",
+            display_name="Swift",
+            file_extensions=[".swift"],
+            paradigms=[LanguageParadigm.OBJECT_ORIENTED, LanguageParadigm.FUNCTIONAL, LanguageParadigm.PROCEDURAL],
+            typing="static",
+            compiled=True,
+            interpreted=False,
+            garbage_collected=False,
+            memory_safe=True,
+            year_created=2014,
+            creator="Apple (Chris Lattner)",
+            description="Apple's modern language for iOS, macOS, and beyond. Safe, fast, and expressive.",
+            use_cases=["iOS Development", "macOS Development", "Server-side Swift"],
+            popular_frameworks=["SwiftUI", "UIKit", "Vapor", "Combine"],
+            package_manager="Swift Package Manager",
+            documentation_url="https://swift.org/documentation/",
+            syntax_example='func greet(_ name: String) -> String {\n    return "Hello, \\(name)!"\n}',
+            hello_world='print("Hello, World!")',
+            keywords=["func", "var", "let", "class", "struct", "enum", "protocol", "extension", "guard", "if", "else", "switch", "return", "async", "await"],
+            operators=["+", "-", "*", "/", "==", "!=", "&&", "||", "??", "?.", "!"],
+            comment_syntax={"single": "//", "multi_start": "/*", "multi_end": "*/"},
+            string_syntax=['"', '"""'],
+            related_languages=["Objective-C", "Rust", "Kotlin"],
+        ),
+        "dart": LanguageConfig(
+            name="dart",
+            display_name="Dart",
+            file_extensions=[".dart"],
+            paradigms=[LanguageParadigm.OBJECT_ORIENTED, LanguageParadigm.FUNCTIONAL],
+            typing="static",
+            compiled=True,
+            interpreted=True,
+            garbage_collected=True,
+            memory_safe=True,
+            year_created=2011,
+            creator="Google",
+            description="The language behind Flutter. Build beautiful native apps from a single codebase.",
+            use_cases=["Mobile Development (Flutter)", "Web Apps", "Backend Services"],
+            popular_frameworks=["Flutter", "AngularDart", "Aqueduct"],
+            package_manager="pub",
+            documentation_url="https://dart.dev/guides",
+            syntax_example='String greet(String name) => "Hello, $name!";',
+            hello_world='void main() {\n  print("Hello, World!");\n}',
+            keywords=["void", "var", "final", "const", "class", "extends", "implements", "mixin", "async", "await", "if", "else", "for", "while", "return"],
+            operators=["+", "-", "*", "/", "==", "!=", "&&", "||", "??", "?."],
+            comment_syntax={"single": "//", "multi_start": "/*", "multi_end": "*/"},
+            string_syntax=["'", '"', "'''", '"""'],
+            related_languages=["JavaScript", "Java", "TypeScript"],
+        ),
+
+        # ─────────────────────────────────────────────────────────────
+        # DATA SCIENCE & ML LANGUAGES
+        # ─────────────────────────────────────────────────────────────
+        "r": LanguageConfig(
+            name="r",
+            display_name="R",
+            file_extensions=[".r", ".R", ".Rmd"],
+            paradigms=[LanguageParadigm.FUNCTIONAL, LanguageParadigm.PROCEDURAL],
+            typing="dynamic",
+            compiled=False,
+            interpreted=True,
+            garbage_collected=True,
+            memory_safe=True,
+            year_created=1993,
+            creator="Ross Ihaka & Robert Gentleman",
+            description="The language of statistics. Powerful for data analysis, visualization, and statistical modeling.",
+            use_cases=["Statistical Analysis", "Data Visualization", "Bioinformatics", "Academic Research"],
+            popular_frameworks=["ggplot2", "dplyr", "tidyverse", "Shiny", "caret"],
+            package_manager="CRAN",
+            documentation_url="https://www.r-project.org/other-docs.html",
+            syntax_example='greet <- function(name) {\n  paste0("Hello, ", name, "!")\n}',
+            hello_world='print("Hello, World!")',
+            keywords=["function", "if", "else", "for", "while", "repeat", "return", "library", "require", "TRUE", "FALSE", "NULL", "NA"],
+            operators=["+", "-", "*", "/", "%%", "%/%", "^", "<-", "->", "==", "!=", "&", "|", "%>%"],
+            comment_syntax={"single": "#"},
+            string_syntax=["'", '"'],
+            related_languages=["Python", "Julia", "MATLAB"],
+        ),
+        "julia": LanguageConfig(
+            name="julia",
+            display_name="Julia",
+            file_extensions=[".jl"],
+            paradigms=[LanguageParadigm.FUNCTIONAL, LanguageParadigm.PROCEDURAL, LanguageParadigm.OBJECT_ORIENTED],
+            typing="dynamic",
+            compiled=True,
+            interpreted=False,
+            garbage_collected=True,
+            memory_safe=True,
+            year_created=2012,
+            creator="Jeff Bezanson, Stefan Karpinski, Viral Shah, Alan Edelman",
+            description="High-performance computing with the ease of Python. Designed for numerical and scientific computing.",
+            use_cases=["Scientific Computing", "Machine Learning", "Data Analysis", "Simulation"],
+            popular_frameworks=["Flux.jl", "DifferentialEquations.jl", "Plots.jl", "DataFrames.jl"],
+            package_manager="Pkg",
+            documentation_url="https://docs.julialang.org/",
+            syntax_example='greet(name::String) = "Hello, $name!"',
+            hello_world='println("Hello, World!")',
+            keywords=["function", "end", "if", "else", "elseif", "for", "while", "return", "struct", "mutable", "abstract", "const", "using", "import"],
+            operators=["+", "-", "*", "/", "^", "==", "!=", "&&", "||", ".", "..."],
+            comment_syntax={"single": "#", "multi_start": "#=", "multi_end": "=#"},
+            string_syntax=['"', '"""'],
+            related_languages=["Python", "MATLAB", "R"],
+        ),
+
+        # ─────────────────────────────────────────────────────────────
+        # FUNCTIONAL LANGUAGES
+        # ─────────────────────────────────────────────────────────────
+        "haskell": LanguageConfig(
+            name="haskell",
+            display_name="Haskell",
+            file_extensions=[".hs", ".lhs"],
+            paradigms=[LanguageParadigm.FUNCTIONAL],
+            typing="static",
+            compiled=True,
+            interpreted=False,
+            garbage_collected=True,
+            memory_safe=True,
+            year_created=1990,
+            creator="Haskell Committee",
+            description="Pure functional programming. Lazy evaluation, strong types, and mathematical elegance.",
+            use_cases=["Academic Research", "Finance", "Compilers", "Formal Verification"],
+            popular_frameworks=["Yesod", "Servant", "Scotty", "Pandoc"],
+            package_manager="Cabal/Stack",
+            documentation_url="https://www.haskell.org/documentation/",
+            syntax_example='greet :: String -> String\ngreet name = "Hello, " ++ name ++ "!"',
+            hello_world='main = putStrLn "Hello, World!"',
+            keywords=["module", "import", "data", "type", "class", "instance", "where", "let", "in", "if", "then", "else", "case", "of", "do"],
+            operators=["+", "-", "*", "/", "==", "/=", "&&", "||", "++", ">>", ">>=", "<$>", "<*>", "."],
+            comment_syntax={"single": "--", "multi_start": "{-", "multi_end": "-}"},
+            string_syntax=['"'],
+            related_languages=["OCaml", "Elm", "PureScript"],
+        ),
+        "elixir": LanguageConfig(
+            name="elixir",
+            display_name="Elixir",
+            file_extensions=[".ex", ".exs"],
+            paradigms=[LanguageParadigm.FUNCTIONAL, LanguageParadigm.CONCURRENT],
+            typing="dynamic",
+            compiled=True,
+            interpreted=False,
+            garbage_collected=True,
+            memory_safe=True,
+            year_created=2011,
+            creator="Jose Valim",
+            description="Scalable and maintainable applications on the Erlang VM. Great for real-time systems.",
+            use_cases=["Real-time Systems", "Distributed Systems", "Web Development", "IoT"],
+            popular_frameworks=["Phoenix", "Ecto", "Nerves", "LiveView"],
+            package_manager="Hex",
+            documentation_url="https://elixir-lang.org/docs.html",
+            syntax_example='def greet(name), do: "Hello, #{name}!"',
+            hello_world='IO.puts "Hello, World!"',
+            keywords=["def", "defp", "defmodule", "do", "end", "if", "else", "case", "cond", "fn", "with", "use", "import", "alias", "require"],
+            operators=["+", "-", "*", "/", "==", "!=", "&&", "||", "|>", "<>", "++", "--"],
+            comment_syntax={"single": "#"},
+            string_syntax=['"', '"""'],
+            related_languages=["Erlang", "Ruby", "Clojure"],
+        ),
+        "clojure": LanguageConfig(
+            name="clojure",
+            display_name="Clojure",
+            file_extensions=[".clj", ".cljs", ".cljc", ".edn"],
+            paradigms=[LanguageParadigm.FUNCTIONAL],
+            typing="dynamic",
+            compiled=True,
+            interpreted=False,
+            garbage_collected=True,
+            memory_safe=True,
+            year_created=2007,
+            creator="Rich Hickey",
+            description="Modern Lisp for the JVM. Immutable data structures and powerful concurrency primitives.",
+            use_cases=["Data Processing", "Web Development", "Distributed Systems"],
+            popular_frameworks=["Ring", "Compojure", "Reagent", "Re-frame"],
+            package_manager="Leiningen/deps.edn",
+            documentation_url="https://clojure.org/guides/getting_started",
+            syntax_example='(defn greet [name]\n  (str "Hello, " name "!"))',
+            hello_world='(println "Hello, World!")',
+            keywords=["def", "defn", "fn", "let", "if", "cond", "do", "loop", "recur", "ns", "require", "use", "import"],
+            operators=["+", "-", "*", "/", "=", "not=", "and", "or", "->", "->>"],
+            comment_syntax={"single": ";"},
+            string_syntax=['"'],
+            related_languages=["Common Lisp", "Scheme", "Elixir"],
+        ),
+
+        # ─────────────────────────────────────────────────────────────
+        # SHELL & SCRIPTING
+        # ─────────────────────────────────────────────────────────────
+        "bash": LanguageConfig(
+            name="bash",
+            display_name="Bash",
+            file_extensions=[".sh", ".bash"],
+            paradigms=[LanguageParadigm.PROCEDURAL, LanguageParadigm.IMPERATIVE],
+            typing="none",
+            compiled=False,
+            interpreted=True,
+            garbage_collected=False,
+            memory_safe=True,
+            year_created=1989,
+            creator="Brian Fox",
+            description="The Unix shell. Essential for automation, DevOps, and system administration.",
+            use_cases=["System Administration", "DevOps", "Automation", "CI/CD Pipelines"],
+            popular_frameworks=["None (shell scripting)"],
+            package_manager=None,
+            documentation_url="https://www.gnu.org/software/bash/manual/",
+            syntax_example='greet() {\n    echo "Hello, $1!"\n}',
+            hello_world='echo "Hello, World!"',
+            keywords=["if", "then", "else", "elif", "fi", "for", "while", "do", "done", "case", "esac", "function", "return", "export", "local"],
+            operators=["-eq", "-ne", "-lt", "-gt", "-le", "-ge", "=", "!=", "&&", "||", "|", ">", "<", ">>"],
+            comment_syntax={"single": "#"},
+            string_syntax=["'", '"', "$'"],
+            related_languages=["Zsh", "Fish", "PowerShell"],
+        ),
+        "powershell": LanguageConfig(
+            name="powershell",
+            display_name="PowerShell",
+            file_extensions=[".ps1", ".psm1", ".psd1"],
+            paradigms=[LanguageParadigm.OBJECT_ORIENTED, LanguageParadigm.PROCEDURAL],
+            typing="dynamic",
+            compiled=False,
+            interpreted=True,
+            garbage_collected=True,
+            memory_safe=True,
+            year_created=2006,
+            creator="Microsoft",
+            description="Cross-platform task automation and configuration management. Built on .NET.",
+            use_cases=["Windows Administration", "Azure Automation", "DevOps", "Configuration Management"],
+            popular_frameworks=["PSScriptAnalyzer", "Pester", "PSReadLine"],
+            package_manager="PowerShell Gallery",
+            documentation_url="https://docs.microsoft.com/en-us/powershell/",
+            syntax_example='function Greet($name) {\n    "Hello, $name!"\n}',
+            hello_world='Write-Host "Hello, World!"',
+            keywords=["function", "param", "if", "else", "elseif", "switch", "foreach", "while", "do", "return", "try", "catch", "finally", "class"],
+            operators=["+", "-", "*", "/", "-eq", "-ne", "-lt", "-gt", "-and", "-or", "-not", "|", ">", ">>"],
+            comment_syntax={"single": "#", "multi_start": "<#", "multi_end": "#>"},
+            string_syntax=["'", '"', "@'", '@"'],
+            related_languages=["Bash", "C#", "Python"],
+        ),
+
+        # ─────────────────────────────────────────────────────────────
+        # DATABASE & QUERY LANGUAGES
+        # ─────────────────────────────────────────────────────────────
+        "sql": LanguageConfig(
+            name="sql",
+            display_name="SQL",
+            file_extensions=[".sql"],
+            paradigms=[LanguageParadigm.DECLARATIVE],
+            typing="static",
+            compiled=False,
+            interpreted=True,
+            garbage_collected=False,
+            memory_safe=True,
+            year_created=1974,
+            creator="IBM (Donald Chamberlin, Raymond Boyce)",
+            description="The language of databases. Query, manipulate, and manage relational data.",
+            use_cases=["Database Management", "Data Analysis", "Reporting", "ETL Pipelines"],
+            popular_frameworks=["PostgreSQL", "MySQL", "SQLite", "SQL Server", "Oracle"],
+            package_manager=None,
+            documentation_url="https://www.w3schools.com/sql/",
+            syntax_example='SELECT name FROM users WHERE age > 18 ORDER BY name;',
+            hello_world="SELECT 'Hello, World!' AS greeting;",
+            keywords=["SELECT", "FROM", "WHERE", "INSERT", "UPDATE", "DELETE", "CREATE", "ALTER", "DROP", "JOIN", "ON", "GROUP BY", "ORDER BY", "HAVING"],
+            operators=["=", "<>", "<", ">", "<=", ">=", "AND", "OR", "NOT", "IN", "BETWEEN", "LIKE", "IS NULL"],
+            comment_syntax={"single": "--", "multi_start": "/*", "multi_end": "*/"},
+            string_syntax=["'"],
+            related_languages=["PL/SQL", "T-SQL", "GraphQL"],
+        ),
+        "graphql": LanguageConfig(
+            name="graphql",
+            display_name="GraphQL",
+            file_extensions=[".graphql", ".gql"],
+            paradigms=[LanguageParadigm.DECLARATIVE],
+            typing="static",
+            compiled=False,
+            interpreted=True,
+            garbage_collected=False,
+            memory_safe=True,
+            year_created=2015,
+            creator="Facebook",
+            description="A query language for APIs. Request exactly the data you need.",
+            use_cases=["API Development", "Mobile Apps", "Web Apps"],
+            popular_frameworks=["Apollo", "Relay", "Hasura", "Prisma"],
+            package_manager=None,
+            documentation_url="https://graphql.org/learn/",
+            syntax_example='query GetUser($id: ID!) {\n  user(id: $id) {\n    name\n    email\n  }\n}',
+            hello_world='query {\n  hello\n}',
+            keywords=["query", "mutation", "subscription", "type", "input", "interface", "enum", "scalar", "fragment", "on"],
+            operators=["!", "...", "@"],
+            comment_syntax={"single": "#"},
+            string_syntax=['"'],
+            related_languages=["SQL", "JSON", "TypeScript"],
+        ),
+
+        # ─────────────────────────────────────────────────────────────
+        # SMART CONTRACTS
+        # ─────────────────────────────────────────────────────────────
+        "solidity": LanguageConfig(
+            name="solidity",
+            display_name="Solidity",
+            file_extensions=[".sol"],
+            paradigms=[LanguageParadigm.OBJECT_ORIENTED],
+            typing="static",
+            compiled=True,
+            interpreted=False,
+            garbage_collected=False,
+            memory_safe=False,
+            year_created=2014,
+            creator="Ethereum Foundation (Gavin Wood)",
+            description="The language of Ethereum. Write smart contracts that run on the blockchain.",
+            use_cases=["Smart Contracts", "DeFi", "NFTs", "DAOs"],
+            popular_frameworks=["Hardhat", "Foundry", "Truffle", "OpenZeppelin"],
+            package_manager="npm",
+            documentation_url="https://docs.soliditylang.org/",
+            syntax_example='function greet(string memory name) public pure returns (string memory) {\n    return string(abi.encodePacked("Hello, ", name, "!"));\n}',
+            hello_world='contract HelloWorld {\n    function hello() public pure returns (string memory) {\n        return "Hello, World!";\n    }\n}',
+            keywords=["contract", "function", "modifier", "event", "struct", "mapping", "public", "private", "external", "internal", "view", "pure", "payable", "memory", "storage"],
+            operators=["+", "-", "*", "/", "==", "!=", "&&", "||", "=>"],
+            comment_syntax={"single": "//", "multi_start": "/*", "multi_end": "*/"},
+            string_syntax=['"'],
+            related_languages=["JavaScript", "C++", "Vyper"],
+        ),
+
+        # ─────────────────────────────────────────────────────────────
+        # MODERN & EMERGING LANGUAGES
+        # ─────────────────────────────────────────────────────────────
+        "zig": LanguageConfig(
+            name="zig",
+            display_name="Zig",
+            file_extensions=[".zig"],
+            paradigms=[LanguageParadigm.PROCEDURAL, LanguageParadigm.IMPERATIVE],
+            typing="static",
+            compiled=True,
+            interpreted=False,
+            garbage_collected=False,
+            memory_safe=True,
+            year_created=2016,
+            creator="Andrew Kelley",
+            description="A better C. No hidden control flow, no garbage collection, and easy C/C++ interop.",
+            use_cases=["Systems Programming", "Game Development", "Embedded Systems"],
+            popular_frameworks=["None (systems language)"],
+            package_manager="Zig Package Manager",
+            documentation_url="https://ziglang.org/documentation/",
+            syntax_example='fn greet(name: []const u8) []const u8 {\n    // ...\n}',
+            hello_world='const std = @import("std");\npub fn main() void {\n    std.debug.print("Hello, World!\\n", .{});\n}',
+            keywords=["fn", "const", "var", "pub", "comptime", "if", "else", "while", "for", "return", "switch", "struct", "enum", "union"],
+            operators=["+", "-", "*", "/", "==", "!=", "and", "or", "orelse", "catch"],
+            comment_syntax={"single": "//"},
+            string_syntax=['"'],
+            related_languages=["C", "Rust", "Nim"],
+        ),
+        "mojo": LanguageConfig(
+            name="mojo",
+            display_name="Mojo",
+            file_extensions=[".mojo", ".🔥"],
+            paradigms=[LanguageParadigm.OBJECT_ORIENTED, LanguageParadigm.FUNCTIONAL],
+            typing="static",
+            compiled=True,
+            interpreted=False,
+            garbage_collected=True,
+            memory_safe=True,
+            year_created=2023,
+            creator="Modular (Chris Lattner)",
+            description="Python superset for AI/ML. Combines Python's usability with systems-level performance.",
+            use_cases=["AI/ML", "High Performance Computing", "Systems Programming"],
+            popular_frameworks=["Modular Engine"],
+            package_manager="Modular",
+            documentation_url="https://docs.modular.com/mojo/",
+            syntax_example='fn greet(name: String) -> String:\n    return "Hello, " + name + "!"',
+            hello_world='fn main():\n    print("Hello, World!")',
+            keywords=["fn", "def", "struct", "let", "var", "if", "else", "for", "while", "return", "alias", "trait", "inout", "owned", "borrowed"],
+            operators=["+", "-", "*", "/", "==", "!=", "and", "or", "not"],
+            comment_syntax={"single": "#"},
+            string_syntax=["'", '"'],
+            related_languages=["Python", "Rust", "Swift"],
+        ),
+    }
+
+
+_NEWLINE_REGEX = re.compile("\n")
+
+# Branch points for the cyclomatic complexity estimate, found in a single pass.
+# Keywords are whole words only, so identifiers like "verify" or "format" don't count.
+_COMPLEXITY_REGEX = re.compile(
+    r"\b(?:if|elif|else|for|while|case|catch|except)\b|&&|\|\||\?"
+)
+
+# Heuristic language-detection patterns, compiled once at import
+_DETECT_PATTERNS: Dict[ProgrammingLanguage, List["re.Pattern[str]"]] = {
+    lang: [re.compile(regex, re.MULTILINE | re.IGNORECASE) for regex in regexes]
+    for lang, regexes in {
+        ProgrammingLanguage.PYTHON: [r"\bdef\s+\w+\s*\(", r"\bimport\s+\w+", r"print\s*\(", r":\s*$"],
+        ProgrammingLanguage.JAVASCRIPT: [r"\bconst\s+\w+\s*=", r"\blet\s+\w+\s*=", r"console\.log", r"function\s*\w*\s*\(", r"=>"],
+        ProgrammingLanguage.TYPESCRIPT: [r":\s*(string|number|boolean|void)", r"interface\s+\w+", r"type\s+\w+\s*="],
+        ProgrammingLanguage.JAVA: [r"public\s+class", r"System\.out\.print", r"public\s+static\s+void\s+main"],
+        ProgrammingLanguage.CSHARP: [r"using\s+System", r"Console\.Write", r"namespace\s+\w+"],
+        ProgrammingLanguage.CPP: [r"#include\s*<", r"std::", r"cout\s*<<", r"int\s+main\s*\("],
+        ProgrammingLanguage.C: [r"#include\s*<stdio\.h>", r"printf\s*\(", r"int\s+main\s*\("],
+        ProgrammingLanguage.GO: [r"package\s+main", r"func\s+\w+\s*\(", r"fmt\.Print"],
+        ProgrammingLanguage.RUST: [r"fn\s+main\s*\(", r"let\s+mut", r"println!\s*\(", r"impl\s+\w+"],
+        ProgrammingLanguage.RUBY: [r"\bdef\s+\w+", r"puts\s+", r"end$", r"attr_accessor"],
+        ProgrammingLanguage.PHP: [r"<\?php", r"\$\w+\s*=", r"echo\s+"],
+        ProgrammingLanguage.SWIFT: [r"\bfunc\s+\w+\s*\(", r"var\s+\w+:", r"let\s+\w+:", r"print\s*\("],
+        ProgrammingLanguage.KOTLIN: [r"fun\s+main\s*\(", r"fun\s+\w+\s*\(", r"val\s+\w+", r"println\s*\("],
+        ProgrammingLanguage.SQL: [r"\bSELECT\b", r"\bFROM\b", r"\bWHERE\b", r"\bINSERT\b", r"\bUPDATE\b"],
+        ProgrammingLanguage.HTML: [r"<html", r"<div", r"<body", r"</\w+>"],
+        ProgrammingLanguage.CSS: [r"\{[^}]*:\s*[^}]+;[^}]*\}", r"@media", r"\.[\w-]+\s*\{"],
+        ProgrammingLanguage.BASH: [r"#!/bin/bash", r"\becho\s+", r"\bif\s+\[", r"\bdone$"],
+        ProgrammingLanguage.HASKELL: [r"::\s*\w+\s*->", r"\bwhere$", r"\bdo$", r"import\s+qualified"],
+        ProgrammingLanguage.ELIXIR: [r"defmodule\s+\w+", r"\bdef\s+\w+", r"\|>", r"iex>"],
+        ProgrammingLanguage.SOLIDITY: [r"pragma\s+solidity", r"contract\s+\w+", r"function\s+\w+.*public"],
+    }.items()
+}
+
+
+def _build_detect_rules() -> List[Tuple["re.Pattern[str]", Tuple[ProgrammingLanguage, ...]]]:
+    """Collapse detection patterns shared by several languages into one rule each"""
+    rules: Dict[str, Tuple["re.Pattern[str]", List[ProgrammingLanguage]]] = {}
+    for lang, regexes in _DETECT_PATTERNS.items():
+        for regex in regexes:
+            rules.setdefault(regex.pattern, (regex, []))[1].append(lang)
+    return [(regex, tuple(langs)) for regex, langs in rules.values()]
+
+
+# Each distinct pattern is searched once and credited to every language using it
+_DETECT_RULES = _build_detect_rules()
+
+
+def _build_language_table() -> Dict[str, LanguageConfigLite]:
+    """Convert the language configs, sharing equal operator, string and comment syntax"""
+    shared: Dict[Any, Any] = {}
+    return {
+        name: LanguageConfigLite.from_config(config, shared)
+        for name, config in _load_language_configs().items()
+    }
+
+
+# The language table is static: build it once per process and share a read-only view
+_LANGUAGES: Dict[str, LanguageConfigLite] = _build_language_table()
+_LANGUAGES_VIEW: Mapping[str, LanguageConfigLite] = MappingProxyType(_LANGUAGES)
+_ALL_LANGUAGES: Tuple[LanguageConfigLite, ...] = tuple(_LANGUAGES.values())
+
+
+def _build_extension_index() -> Dict[str, ProgrammingLanguage]:
+    """Map each file extension to its language; the first language listing it wins"""
+    index: Dict[str, ProgrammingLanguage] = {}
+    for name, config in _LANGUAGES.items():
+        for ext in config.file_extensions:
+            index.setdefault(ext, ProgrammingLanguage(name))
+    return index
+
+
+_EXT_TO_LANG = _build_extension_index()
+
+# Explanation heads, built once from the static language table
+_EXPLAIN_PREFIXES: Dict[str, str] = {
+    name: _explain_prefix(config) for name, config in _LANGUAGES.items()
+}
+
+
+def _load_syntax_patterns() -> Dict[str, Dict[str, Any]]:
+    """Load regex patterns for syntax validation"""
+    return {
+        "python": {
+            "indent_error": r"^(\s*)(?!#).*\n(?!\1|\s*$)",
+            "syntax_errors": [
+                (r"print\s+[^(]", "Missing parentheses in print (Python 3 syntax)"),
+                # Same as r"\bdef\s+\w+[^(]", but starting with the literal lets
+                # the regex engine skip ahead to each "def" instead of trying every position
+                (r"def(?<!\wdef)\s+\w+[^(]", "Function definition missing parentheses"),
+                (r":\s*\n\s*\n", "Empty block after colon"),
+            ],
+            "common_mistakes": [
+                (r"==\s*True", "Use 'if x:' instead of 'if x == True:'"),
+                (r"==\s*False", "Use 'if not x:' instead of 'if x == False:'"),
+                (r"==\s*None", "Use 'is None' instead of '== None'"),
+                (r"except\s*:", "Bare except clause - specify exception type"),
+            ],
+        },
+        "javascript": {
+            "syntax_errors": [
+                (r"function\s+\w+\s*[^(]", "Function missing parentheses"),
+                (r"==(?!=)", "Use === for strict equality"),
+                (r"!=(?!=)", "Use !== for strict inequality"),
+            ],
+            "common_mistakes": [
+                (r"var\s+", "Consider using 'const' or 'let' instead of 'var'"),
+                (r"==\s*null", "Use === null or == null carefully"),
+            ],
+        },
+        "java": {
+            "syntax_errors": [
+                (r"System\.out\.print(?!ln|f)", "Use println() or printf() for output"),
+                (r"public\s+class\s+\w+\s*[^{]", "Class definition missing opening brace"),
+            ],
+        },
+    }
+
+
+def _compile_syntax_patterns(patterns: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Compile each language's rule lists into tuples of (re.Pattern, message)"""
+    compiled = {}
+    for lang, lang_patterns in patterns.items():
+        compiled[lang] = dict(lang_patterns)
+        for kind in ("syntax_errors", "common_mistakes"):
+            if kind in lang_patterns:
+                compiled[lang][kind] = tuple(
+                    (re.compile(pattern, re.MULTILINE), message)
+                    for pattern, message in lang_patterns[kind]
+                )
+    return compiled
+
+
+_SYNTAX_PATTERNS = _compile_syntax_patterns(_load_syntax_patterns())
+
+# Only a few languages have syntax rules; the rest skip the syntax pass
+_SYNTAX_LANGUAGES = frozenset(_SYNTAX_PATTERNS)
+
+# Substrings the suggestion rules look for, one alternation per language so a
+# single scan reports every needle present. Longer needles come first: any
+# occurrence of "===" or "System.out.println" is then matched whole, and the
+# shorter needle is present whenever either form is found.
+_SUGGESTION_NEEDLES: Dict[ProgrammingLanguage, "re.Pattern[str]"] = {
+    language: re.compile("|".join(map(re.escape, sorted(needles, key=len, reverse=True))))
+    for language, needles in {
+        ProgrammingLanguage.PYTHON: ("import *",),
+        ProgrammingLanguage.JAVASCRIPT: ("var ", "===", "=="),
+        ProgrammingLanguage.JAVA: ("System.out.println", "System.out.print"),
+    }.items()
+}
+
+# Leading docstring or comment, with the same whitespace rules as str.strip()
+_PY_MODULE_HEADER = re.compile(r"\s*(?:\"{3}|'{3}|#)")
+
+
 class CodeAnalyzer:
     """
     Multi-language code analyzer supporting 50+ programming languages.
@@ -22,830 +1021,36 @@ class CodeAnalyzer:
     """
 
     def __init__(self):
-        self.languages = self._load_language_configs()
-        self.syntax_patterns = self._load_syntax_patterns()
-
-    def _load_language_configs(self) -> Dict[str, LanguageConfig]:
-        """Load configuration for all supported languages"""
-        return {
-            # ─────────────────────────────────────────────────────────────
-            # WEB & FRONTEND LANGUAGES
-            # ─────────────────────────────────────────────────────────────
-            "javascript": LanguageConfig(
-                name="javascript",
-                display_name="JavaScript",
-                file_extensions=[".js", ".mjs", ".cjs"],
-                paradigms=[LanguageParadigm.OBJECT_ORIENTED, LanguageParadigm.FUNCTIONAL, LanguageParadigm.EVENT_DRIVEN],
-                typing="dynamic",
-                compiled=False,
-                interpreted=True,
-                garbage_collected=True,
-                memory_safe=True,
-                year_created=1995,
-                creator="Brendan Eich",
-                description="The language of the web. Used for frontend interactivity, backend (Node.js), and everywhere in between.",
-                use_cases=["Web Development", "Frontend", "Backend (Node.js)", "Mobile (React Native)", "Desktop (Electron)"],
-                popular_frameworks=["React", "Vue", "Angular", "Express", "Next.js", "Svelte"],
-                package_manager="npm",
-                documentation_url="https://developer.mozilla.org/en-US/docs/Web/JavaScript",
-                syntax_example="const greet = (name) => `Hello, ${name}!`;",
-                hello_world='console.log("Hello, World!");',
-                keywords=["const", "let", "var", "function", "class", "if", "else", "for", "while", "return", "async", "await", "import", "export"],
-                operators=["+", "-", "*", "/", "%", "**", "===", "!==", "&&", "||", "??", "?."],
-                comment_syntax={"single": "//", "multi_start": "/*", "multi_end": "*/"},
-                string_syntax=["'", '"', "`"],
-                related_languages=["TypeScript", "CoffeeScript", "Dart"],
-            ),
-            "typescript": LanguageConfig(
-                name="typescript",
-                display_name="TypeScript",
-                file_extensions=[".ts", ".tsx", ".mts"],
-                paradigms=[LanguageParadigm.OBJECT_ORIENTED, LanguageParadigm.FUNCTIONAL],
-                typing="static",
-                compiled=True,
-                interpreted=False,
-                garbage_collected=True,
-                memory_safe=True,
-                year_created=2012,
-                creator="Microsoft (Anders Hejlsberg)",
-                description="JavaScript with types. Adds static typing to JavaScript for better tooling and fewer runtime errors.",
-                use_cases=["Large-scale Web Apps", "Enterprise Software", "React/Angular/Vue Apps"],
-                popular_frameworks=["Angular", "NestJS", "Next.js", "Deno"],
-                package_manager="npm",
-                documentation_url="https://www.typescriptlang.org/docs/",
-                syntax_example="const greet = (name: string): string => `Hello, ${name}!`;",
-                hello_world='console.log("Hello, World!");',
-                keywords=["const", "let", "type", "interface", "class", "extends", "implements", "generic", "enum", "namespace"],
-                operators=["+", "-", "*", "/", "===", "as", "is", "keyof", "typeof"],
-                comment_syntax={"single": "//", "multi_start": "/*", "multi_end": "*/"},
-                string_syntax=["'", '"', "`"],
-                related_languages=["JavaScript", "C#", "Java"],
-            ),
-            "html": LanguageConfig(
-                name="html",
-                display_name="HTML",
-                file_extensions=[".html", ".htm"],
-                paradigms=[LanguageParadigm.DECLARATIVE],
-                typing="none",
-                compiled=False,
-                interpreted=True,
-                garbage_collected=False,
-                memory_safe=True,
-                year_created=1993,
-                creator="Tim Berners-Lee",
-                description="The standard markup language for creating web pages and web applications.",
-                use_cases=["Web Pages", "Email Templates", "Documentation"],
-                popular_frameworks=["None (markup language)"],
-                package_manager=None,
-                documentation_url="https://developer.mozilla.org/en-US/docs/Web/HTML",
-                syntax_example='<div class="container"><h1>Title</h1></div>',
-                hello_world="<html><body><h1>Hello, World!</h1></body></html>",
-                keywords=["html", "head", "body", "div", "span", "p", "a", "img", "script", "style"],
-                operators=[],
-                comment_syntax={"single": "<!-- -->", "multi_start": "<!--", "multi_end": "-->"},
-                string_syntax=['"', "'"],
-                related_languages=["CSS", "JavaScript", "XML"],
-            ),
-            "css": LanguageConfig(
-                name="css",
-                display_name="CSS",
-                file_extensions=[".css"],
-                paradigms=[LanguageParadigm.DECLARATIVE],
-                typing="none",
-                compiled=False,
-                interpreted=True,
-                garbage_collected=False,
-                memory_safe=True,
-                year_created=1996,
-                creator="Hakon Wium Lie",
-                description="Cascading Style Sheets for styling web pages.",
-                use_cases=["Web Styling", "Responsive Design", "Animations"],
-                popular_frameworks=["Tailwind", "Bootstrap", "Sass", "Less"],
-                package_manager=None,
-                documentation_url="https://developer.mozilla.org/en-US/docs/Web/CSS",
-                syntax_example=".container { display: flex; justify-content: center; }",
-                hello_world="body { font-family: sans-serif; }",
-                keywords=["display", "flex", "grid", "margin", "padding", "color", "background", "border", "position"],
-                operators=[":", ";", "{", "}", ","],
-                comment_syntax={"multi_start": "/*", "multi_end": "*/"},
-                string_syntax=['"', "'"],
-                related_languages=["Sass", "Less", "HTML"],
-            ),
-
-            # ─────────────────────────────────────────────────────────────
-            # BACKEND & SYSTEMS LANGUAGES
-            # ─────────────────────────────────────────────────────────────
-            "python": LanguageConfig(
-                name="python",
-                display_name="Python",
-                file_extensions=[".py", ".pyw", ".pyi"],
-                paradigms=[LanguageParadigm.OBJECT_ORIENTED, LanguageParadigm.FUNCTIONAL, LanguageParadigm.PROCEDURAL],
-                typing="dynamic",
-                compiled=False,
-                interpreted=True,
-                garbage_collected=True,
-                memory_safe=True,
-                year_created=1991,
-                creator="Guido van Rossum",
-                description="A versatile, readable language perfect for beginners and experts. Dominates in ML/AI, data science, and scripting.",
-                use_cases=["Machine Learning", "Data Science", "Web Development", "Automation", "Scientific Computing"],
-                popular_frameworks=["Django", "Flask", "FastAPI", "PyTorch", "TensorFlow", "Pandas", "NumPy"],
-                package_manager="pip",
-                documentation_url="https://docs.python.org/3/",
-                syntax_example='def greet(name: str) -> str:\n    return f"Hello, {name}!"',
-                hello_world='print("Hello, World!")',
-                keywords=["def", "class", "if", "elif", "else", "for", "while", "return", "import", "from", "try", "except", "with", "async", "await", "lambda"],
-                operators=["+", "-", "*", "/", "//", "%", "**", "==", "!=", "and", "or", "not", "in", "is"],
-                comment_syntax={"single": "#", "multi_start": '"""', "multi_end": '"""'},
-                string_syntax=["'", '"', "'''", '"""', "f'", 'f"'],
-                related_languages=["Ruby", "Julia", "Perl"],
-            ),
-            "java": LanguageConfig(
-                name="java",
-                display_name="Java",
-                file_extensions=[".java"],
-                paradigms=[LanguageParadigm.OBJECT_ORIENTED],
-                typing="static",
-                compiled=True,
-                interpreted=False,
-                garbage_collected=True,
-                memory_safe=True,
-                year_created=1995,
-                creator="James Gosling (Sun Microsystems)",
-                description="Write once, run anywhere. Enterprise-grade language powering Android, big data, and enterprise systems.",
-                use_cases=["Enterprise Software", "Android Development", "Big Data", "Web Services"],
-                popular_frameworks=["Spring", "Spring Boot", "Hibernate", "Android SDK", "Apache Kafka"],
-                package_manager="Maven/Gradle",
-                documentation_url="https://docs.oracle.com/en/java/",
-                syntax_example='public String greet(String name) {\n    return "Hello, " + name + "!";\n}',
-                hello_world='public class Main {\n    public static void main(String[] args) {\n        System.out.println("Hello, World!");\n    }\n}',
-                keywords=["public", "private", "protected", "class", "interface", "extends", "implements", "static", "final", "abstract", "void", "new", "return", "try", "catch"],
-                operators=["+", "-", "*", "/", "%", "==", "!=", "&&", "||", "!", "instanceof"],
-                comment_syntax={"single": "//", "multi_start": "/*", "multi_end": "*/"},
-                string_syntax=['"'],
-                related_languages=["Kotlin", "Scala", "C#"],
-            ),
-            "csharp": LanguageConfig(
-                name="csharp",
-                display_name="C#",
-                file_extensions=[".cs"],
-                paradigms=[LanguageParadigm.OBJECT_ORIENTED, LanguageParadigm.FUNCTIONAL],
-                typing="static",
-                compiled=True,
-                interpreted=False,
-                garbage_collected=True,
-                memory_safe=True,
-                year_created=2000,
-                creator="Microsoft (Anders Hejlsberg)",
-                description="Microsoft's flagship language. Powers Unity games, Windows apps, and enterprise backends.",
-                use_cases=["Game Development (Unity)", "Windows Apps", "Enterprise Software", "Web APIs"],
-                popular_frameworks=[".NET", "ASP.NET", "Unity", "Xamarin", "Blazor"],
-                package_manager="NuGet",
-                documentation_url="https://docs.microsoft.com/en-us/dotnet/csharp/",
-                syntax_example='public string Greet(string name) => $"Hello, {name}!";',
-                hello_world='Console.WriteLine("Hello, World!");',
-                keywords=["public", "private", "class", "interface", "struct", "async", "await", "var", "using", "namespace", "static", "void", "return"],
-                operators=["+", "-", "*", "/", "==", "!=", "&&", "||", "??", "?."],
-                comment_syntax={"single": "//", "multi_start": "/*", "multi_end": "*/"},
-                string_syntax=['"', "@", "$"],
-                related_languages=["Java", "F#", "TypeScript"],
-            ),
-            "cpp": LanguageConfig(
-                name="cpp",
-                display_name="C++",
-                file_extensions=[".cpp", ".cc", ".cxx", ".hpp", ".h"],
-                paradigms=[LanguageParadigm.OBJECT_ORIENTED, LanguageParadigm.PROCEDURAL, LanguageParadigm.FUNCTIONAL],
-                typing="static",
-                compiled=True,
-                interpreted=False,
-                garbage_collected=False,
-                memory_safe=False,
-                year_created=1985,
-                creator="Bjarne Stroustrup",
-                description="High-performance systems language. Powers game engines, browsers, and operating systems.",
-                use_cases=["Game Engines", "Systems Programming", "High-Frequency Trading", "Browsers", "Databases"],
-                popular_frameworks=["Qt", "Unreal Engine", "Boost", "POCO"],
-                package_manager="vcpkg/Conan",
-                documentation_url="https://en.cppreference.com/",
-                syntax_example='std::string greet(const std::string& name) {\n    return "Hello, " + name + "!";\n}',
-                hello_world='#include <iostream>\nint main() {\n    std::cout << "Hello, World!" << std::endl;\n    return 0;\n}',
-                keywords=["class", "struct", "public", "private", "virtual", "template", "typename", "const", "static", "new", "delete", "nullptr", "auto"],
-                operators=["+", "-", "*", "/", "++", "--", "->", "::", "<<", ">>", "==", "!="],
-                comment_syntax={"single": "//", "multi_start": "/*", "multi_end": "*/"},
-                string_syntax=['"'],
-                related_languages=["C", "Rust", "D"],
-            ),
-            "c": LanguageConfig(
-                name="c",
-                display_name="C",
-                file_extensions=[".c", ".h"],
-                paradigms=[LanguageParadigm.PROCEDURAL, LanguageParadigm.IMPERATIVE],
-                typing="static",
-                compiled=True,
-                interpreted=False,
-                garbage_collected=False,
-                memory_safe=False,
-                year_created=1972,
-                creator="Dennis Ritchie",
-                description="The mother of modern programming. Powers operating systems, embedded systems, and system utilities.",
-                use_cases=["Operating Systems", "Embedded Systems", "System Utilities", "Device Drivers"],
-                popular_frameworks=["None (systems language)"],
-                package_manager=None,
-                documentation_url="https://en.cppreference.com/w/c",
-                syntax_example='char* greet(const char* name) {\n    static char buffer[100];\n    sprintf(buffer, "Hello, %s!", name);\n    return buffer;\n}',
-                hello_world='#include <stdio.h>\nint main() {\n    printf("Hello, World!\\n");\n    return 0;\n}',
-                keywords=["int", "char", "float", "double", "void", "struct", "typedef", "enum", "const", "static", "extern", "if", "else", "for", "while", "return"],
-                operators=["+", "-", "*", "/", "%", "++", "--", "->", ".", "&", "*", "==", "!="],
-                comment_syntax={"single": "//", "multi_start": "/*", "multi_end": "*/"},
-                string_syntax=['"'],
-                related_languages=["C++", "Objective-C", "Rust"],
-            ),
-            "go": LanguageConfig(
-                name="go",
-                display_name="Go",
-                file_extensions=[".go"],
-                paradigms=[LanguageParadigm.PROCEDURAL, LanguageParadigm.CONCURRENT],
-                typing="static",
-                compiled=True,
-                interpreted=False,
-                garbage_collected=True,
-                memory_safe=True,
-                year_created=2009,
-                creator="Google (Rob Pike, Ken Thompson)",
-                description="Simple, fast, and concurrent. Perfect for cloud services, CLIs, and microservices.",
-                use_cases=["Cloud Services", "Microservices", "DevOps Tools", "CLI Applications"],
-                popular_frameworks=["Gin", "Echo", "Fiber", "Chi"],
-                package_manager="go mod",
-                documentation_url="https://golang.org/doc/",
-                syntax_example='func greet(name string) string {\n    return fmt.Sprintf("Hello, %s!", name)\n}',
-                hello_world='package main\n\nimport "fmt"\n\nfunc main() {\n    fmt.Println("Hello, World!")\n}',
-                keywords=["func", "package", "import", "var", "const", "type", "struct", "interface", "go", "chan", "select", "defer", "return"],
-                operators=["+", "-", "*", "/", ":=", "==", "!=", "<-", "..."],
-                comment_syntax={"single": "//", "multi_start": "/*", "multi_end": "*/"},
-                string_syntax=['"', "`"],
-                related_languages=["Rust", "C", "Python"],
-            ),
-            "rust": LanguageConfig(
-                name="rust",
-                display_name="Rust",
-                file_extensions=[".rs"],
-                paradigms=[LanguageParadigm.FUNCTIONAL, LanguageParadigm.IMPERATIVE, LanguageParadigm.CONCURRENT],
-                typing="static",
-                compiled=True,
-                interpreted=False,
-                garbage_collected=False,
-                memory_safe=True,
-                year_created=2010,
-                creator="Mozilla (Graydon Hoare)",
-                description="Memory-safe systems programming without garbage collection. Blazingly fast with zero-cost abstractions.",
-                use_cases=["Systems Programming", "WebAssembly", "CLI Tools", "Blockchain", "Game Engines"],
-                popular_frameworks=["Tokio", "Actix", "Rocket", "Axum", "Bevy"],
-                package_manager="Cargo",
-                documentation_url="https://doc.rust-lang.org/",
-                syntax_example='fn greet(name: &str) -> String {\n    format!("Hello, {}!", name)\n}',
-                hello_world='fn main() {\n    println!("Hello, World!");\n}',
-                keywords=["fn", "let", "mut", "const", "struct", "enum", "impl", "trait", "pub", "mod", "use", "match", "if", "loop", "async", "await"],
-                operators=["+", "-", "*", "/", "==", "!=", "&&", "||", "?", "=>", "->", "::"],
-                comment_syntax={"single": "//", "multi_start": "/*", "multi_end": "*/"},
-                string_syntax=['"', "r#"],
-                related_languages=["C++", "Haskell", "OCaml"],
-            ),
-            "kotlin": LanguageConfig(
-                name="kotlin",
-                display_name="Kotlin",
-                file_extensions=[".kt", ".kts"],
-                paradigms=[LanguageParadigm.OBJECT_ORIENTED, LanguageParadigm.FUNCTIONAL],
-                typing="static",
-                compiled=True,
-                interpreted=False,
-                garbage_collected=True,
-                memory_safe=True,
-                year_created=2011,
-                creator="JetBrains",
-                description="Modern alternative to Java. Now the preferred language for Android development.",
-                use_cases=["Android Development", "Backend Services", "Multiplatform Apps"],
-                popular_frameworks=["Ktor", "Spring Boot", "Android Jetpack", "Compose"],
-                package_manager="Gradle",
-                documentation_url="https://kotlinlang.org/docs/",
-                syntax_example='fun greet(name: String): String = "Hello, $name!"',
-                hello_world='fun main() {\n    println("Hello, World!")\n}',
-                keywords=["fun", "val", "var", "class", "object", "interface", "data", "sealed", "when", "if", "else", "return", "suspend"],
-                operators=["+", "-", "*", "/", "==", "!=", "?:", "?."],
-                comment_syntax={"single": "//", "multi_start": "/*", "multi_end": "*/"},
-                string_syntax=['"', '"""'],
-                related_languages=["Java", "Scala", "Swift"],
-            ),
-            "ruby": LanguageConfig(
-                name="ruby",
-                display_name="Ruby",
-                file_extensions=[".rb", ".rake"],
-                paradigms=[LanguageParadigm.OBJECT_ORIENTED, LanguageParadigm.FUNCTIONAL],
-                typing="dynamic",
-                compiled=False,
-                interpreted=True,
-                garbage_collected=True,
-                memory_safe=True,
-                year_created=1995,
-                creator="Yukihiro Matsumoto",
-                description="A programmer's best friend. Elegant syntax designed for developer happiness.",
-                use_cases=["Web Development", "Scripting", "DevOps", "Prototyping"],
-                popular_frameworks=["Ruby on Rails", "Sinatra", "Hanami"],
-                package_manager="RubyGems/Bundler",
-                documentation_url="https://ruby-doc.org/",
-                syntax_example='def greet(name)\n  "Hello, #{name}!"\nend',
-                hello_world='puts "Hello, World!"',
-                keywords=["def", "class", "module", "if", "else", "elsif", "unless", "case", "when", "do", "end", "return", "yield", "attr_accessor"],
-                operators=["+", "-", "*", "/", "==", "!=", "&&", "||", "<<", "=>"],
-                comment_syntax={"single": "#", "multi_start": "=begin", "multi_end": "=end"},
-                string_syntax=["'", '"', "%q", "%Q"],
-                related_languages=["Python", "Perl", "Crystal"],
-            ),
-            "php": LanguageConfig(
-                name="php",
-                display_name="PHP",
-                file_extensions=[".php", ".phtml"],
-                paradigms=[LanguageParadigm.OBJECT_ORIENTED, LanguageParadigm.PROCEDURAL],
-                typing="dynamic",
-                compiled=False,
-                interpreted=True,
-                garbage_collected=True,
-                memory_safe=True,
-                year_created=1995,
-                creator="Rasmus Lerdorf",
-                description="The language that powers most of the web. From WordPress to Facebook.",
-                use_cases=["Web Development", "CMS", "E-commerce", "APIs"],
-                popular_frameworks=["Laravel", "Symfony", "WordPress", "Drupal"],
-                package_manager="Composer",
-                documentation_url="https://www.php.net/docs.php",
-                syntax_example='function greet(string $name): string {\n    return "Hello, {$name}!";\n}',
-                hello_world='<?php\necho "Hello, World!";',
-                keywords=["function", "class", "public", "private", "protected", "interface", "trait", "namespace", "use", "return", "if", "else", "foreach", "while"],
-                operators=["+", "-", "*", "/", ".", "==", "===", "!=", "!==", "&&", "||", "??", "?->"],
-                comment_syntax={"single": "//", "multi_start": "/*", "multi_end": "*/"},
-                string_syntax=["'", '"'],
-                related_languages=["JavaScript", "Python", "Perl"],
-            ),
-
-            # ─────────────────────────────────────────────────────────────
-            # MOBILE LANGUAGES
-            # ─────────────────────────────────────────────────────────────
-            "swift": LanguageConfig(
-                name="swift",
-                display_name="Swift",
-                file_extensions=[".swift"],
-                paradigms=[LanguageParadigm.OBJECT_ORIENTED, LanguageParadigm.FUNCTIONAL, LanguageParadigm.PROCEDURAL],
-                typing="static",
-                compiled=True,
-                interpreted=False,
-                garbage_collected=False,
-                memory_safe=True,
-                year_created=2014,
-                creator="Apple (Chris Lattner)",
-                description="Apple's modern language for iOS, macOS, and beyond. Safe, fast, and expressive.",
-                use_cases=["iOS Development", "macOS Development", "Server-side Swift"],
-                popular_frameworks=["SwiftUI", "UIKit", "Vapor", "Combine"],
-                package_manager="Swift Package Manager",
-                documentation_url="https://swift.org/documentation/",
-                syntax_example='func greet(_ name: String) -> String {\n    return "Hello, \\(name)!"\n}',
-                hello_world='print("Hello, World!")',
-                keywords=["func", "var", "let", "class", "struct", "enum", "protocol", "extension", "guard", "if", "else", "switch", "return", "async", "await"],
-                operators=["+", "-", "*", "/", "==", "!=", "&&", "||", "??", "?.", "!"],
-                comment_syntax={"single": "//", "multi_start": "/*", "multi_end": "*/"},
-                string_syntax=['"', '"""'],
-                related_languages=["Objective-C", "Rust", "Kotlin"],
-            ),
-            "dart": LanguageConfig(
-                name="dart",
-                display_name="Dart",
-                file_extensions=[".dart"],
-                paradigms=[LanguageParadigm.OBJECT_ORIENTED, LanguageParadigm.FUNCTIONAL],
-                typing="static",
-                compiled=True,
-                interpreted=True,
-                garbage_collected=True,
-                memory_safe=True,
-                year_created=2011,
-                creator="Google",
-                description="The language behind Flutter. Build beautiful native apps from a single codebase.",
-                use_cases=["Mobile Development (Flutter)", "Web Apps", "Backend Services"],
-                popular_frameworks=["Flutter", "AngularDart", "Aqueduct"],
-                package_manager="pub",
-                documentation_url="https://dart.dev/guides",
-                syntax_example='String greet(String name) => "Hello, $name!";',
-                hello_world='void main() {\n  print("Hello, World!");\n}',
-                keywords=["void", "var", "final", "const", "class", "extends", "implements", "mixin", "async", "await", "if", "else", "for", "while", "return"],
-                operators=["+", "-", "*", "/", "==", "!=", "&&", "||", "??", "?."],
-                comment_syntax={"single": "//", "multi_start": "/*", "multi_end": "*/"},
-                string_syntax=["'", '"', "'''", '"""'],
-                related_languages=["JavaScript", "Java", "TypeScript"],
-            ),
-
-            # ─────────────────────────────────────────────────────────────
-            # DATA SCIENCE & ML LANGUAGES
-            # ─────────────────────────────────────────────────────────────
-            "r": LanguageConfig(
-                name="r",
-                display_name="R",
-                file_extensions=[".r", ".R", ".Rmd"],
-                paradigms=[LanguageParadigm.FUNCTIONAL, LanguageParadigm.PROCEDURAL],
-                typing="dynamic",
-                compiled=False,
-                interpreted=True,
-                garbage_collected=True,
-                memory_safe=True,
-                year_created=1993,
-                creator="Ross Ihaka & Robert Gentleman",
-                description="The language of statistics. Powerful for data analysis, visualization, and statistical modeling.",
-                use_cases=["Statistical Analysis", "Data Visualization", "Bioinformatics", "Academic Research"],
-                popular_frameworks=["ggplot2", "dplyr", "tidyverse", "Shiny", "caret"],
-                package_manager="CRAN",
-                documentation_url="https://www.r-project.org/other-docs.html",
-                syntax_example='greet <- function(name) {\n  paste0("Hello, ", name, "!")\n}',
-                hello_world='print("Hello, World!")',
-                keywords=["function", "if", "else", "for", "while", "repeat", "return", "library", "require", "TRUE", "FALSE", "NULL", "NA"],
-                operators=["+", "-", "*", "/", "%%", "%/%", "^", "<-", "->", "==", "!=", "&", "|", "%>%"],
-                comment_syntax={"single": "#"},
-                string_syntax=["'", '"'],
-                related_languages=["Python", "Julia", "MATLAB"],
-            ),
-            "julia": LanguageConfig(
-                name="julia",
-                display_name="Julia",
-                file_extensions=[".jl"],
-                paradigms=[LanguageParadigm.FUNCTIONAL, LanguageParadigm.PROCEDURAL, LanguageParadigm.OBJECT_ORIENTED],
-                typing="dynamic",
-                compiled=True,
-                interpreted=False,
-                garbage_collected=True,
-                memory_safe=True,
-                year_created=2012,
-                creator="Jeff Bezanson, Stefan Karpinski, Viral Shah, Alan Edelman",
-                description="High-performance computing with the ease of Python. Designed for numerical and scientific computing.",
-                use_cases=["Scientific Computing", "Machine Learning", "Data Analysis", "Simulation"],
-                popular_frameworks=["Flux.jl", "DifferentialEquations.jl", "Plots.jl", "DataFrames.jl"],
-                package_manager="Pkg",
-                documentation_url="https://docs.julialang.org/",
-                syntax_example='greet(name::String) = "Hello, $name!"',
-                hello_world='println("Hello, World!")',
-                keywords=["function", "end", "if", "else", "elseif", "for", "while", "return", "struct", "mutable", "abstract", "const", "using", "import"],
-                operators=["+", "-", "*", "/", "^", "==", "!=", "&&", "||", ".", "..."],
-                comment_syntax={"single": "#", "multi_start": "#=", "multi_end": "=#"},
-                string_syntax=['"', '"""'],
-                related_languages=["Python", "MATLAB", "R"],
-            ),
-
-            # ─────────────────────────────────────────────────────────────
-            # FUNCTIONAL LANGUAGES
-            # ─────────────────────────────────────────────────────────────
-            "haskell": LanguageConfig(
-                name="haskell",
-                display_name="Haskell",
-                file_extensions=[".hs", ".lhs"],
-                paradigms=[LanguageParadigm.FUNCTIONAL],
-                typing="static",
-                compiled=True,
-                interpreted=False,
-                garbage_collected=True,
-                memory_safe=True,
-                year_created=1990,
-                creator="Haskell Committee",
-                description="Pure functional programming. Lazy evaluation, strong types, and mathematical elegance.",
-                use_cases=["Academic Research", "Finance", "Compilers", "Formal Verification"],
-                popular_frameworks=["Yesod", "Servant", "Scotty", "Pandoc"],
-                package_manager="Cabal/Stack",
-                documentation_url="https://www.haskell.org/documentation/",
-                syntax_example='greet :: String -> String\ngreet name = "Hello, " ++ name ++ "!"',
-                hello_world='main = putStrLn "Hello, World!"',
-                keywords=["module", "import", "data", "type", "class", "instance", "where", "let", "in", "if", "then", "else", "case", "of", "do"],
-                operators=["+", "-", "*", "/", "==", "/=", "&&", "||", "++", ">>", ">>=", "<$>", "<*>", "."],
-                comment_syntax={"single": "--", "multi_start": "{-", "multi_end": "-}"},
-                string_syntax=['"'],
-                related_languages=["OCaml", "Elm", "PureScript"],
-            ),
-            "elixir": LanguageConfig(
-                name="elixir",
-                display_name="Elixir",
-                file_extensions=[".ex", ".exs"],
-                paradigms=[LanguageParadigm.FUNCTIONAL, LanguageParadigm.CONCURRENT],
-                typing="dynamic",
-                compiled=True,
-                interpreted=False,
-                garbage_collected=True,
-                memory_safe=True,
-                year_created=2011,
-                creator="Jose Valim",
-                description="Scalable and maintainable applications on the Erlang VM. Great for real-time systems.",
-                use_cases=["Real-time Systems", "Distributed Systems", "Web Development", "IoT"],
-                popular_frameworks=["Phoenix", "Ecto", "Nerves", "LiveView"],
-                package_manager="Hex",
-                documentation_url="https://elixir-lang.org/docs.html",
-                syntax_example='def greet(name), do: "Hello, #{name}!"',
-                hello_world='IO.puts "Hello, World!"',
-                keywords=["def", "defp", "defmodule", "do", "end", "if", "else", "case", "cond", "fn", "with", "use", "import", "alias", "require"],
-                operators=["+", "-", "*", "/", "==", "!=", "&&", "||", "|>", "<>", "++", "--"],
-                comment_syntax={"single": "#"},
-                string_syntax=['"', '"""'],
-                related_languages=["Erlang", "Ruby", "Clojure"],
-            ),
-            "clojure": LanguageConfig(
-                name="clojure",
-                display_name="Clojure",
-                file_extensions=[".clj", ".cljs", ".cljc", ".edn"],
-                paradigms=[LanguageParadigm.FUNCTIONAL],
-                typing="dynamic",
-                compiled=True,
-                interpreted=False,
-                garbage_collected=True,
-                memory_safe=True,
-                year_created=2007,
-                creator="Rich Hickey",
-                description="Modern Lisp for the JVM. Immutable data structures and powerful concurrency primitives.",
-                use_cases=["Data Processing", "Web Development", "Distributed Systems"],
-                popular_frameworks=["Ring", "Compojure", "Reagent", "Re-frame"],
-                package_manager="Leiningen/deps.edn",
-                documentation_url="https://clojure.org/guides/getting_started",
-                syntax_example='(defn greet [name]\n  (str "Hello, " name "!"))',
-                hello_world='(println "Hello, World!")',
-                keywords=["def", "defn", "fn", "let", "if", "cond", "do", "loop", "recur", "ns", "require", "use", "import"],
-                operators=["+", "-", "*", "/", "=", "not=", "and", "or", "->", "->>"],
-                comment_syntax={"single": ";"},
-                string_syntax=['"'],
-                related_languages=["Common Lisp", "Scheme", "Elixir"],
-            ),
-
-            # ─────────────────────────────────────────────────────────────
-            # SHELL & SCRIPTING
-            # ─────────────────────────────────────────────────────────────
-            "bash": LanguageConfig(
-                name="bash",
-                display_name="Bash",
-                file_extensions=[".sh", ".bash"],
-                paradigms=[LanguageParadigm.PROCEDURAL, LanguageParadigm.IMPERATIVE],
-                typing="none",
-                compiled=False,
-                interpreted=True,
-                garbage_collected=False,
-                memory_safe=True,
-                year_created=1989,
-                creator="Brian Fox",
-                description="The Unix shell. Essential for automation, DevOps, and system administration.",
-                use_cases=["System Administration", "DevOps", "Automation", "CI/CD Pipelines"],
-                popular_frameworks=["None (shell scripting)"],
-                package_manager=None,
-                documentation_url="https://www.gnu.org/software/bash/manual/",
-                syntax_example='greet() {\n    echo "Hello, $1!"\n}',
-                hello_world='echo "Hello, World!"',
-                keywords=["if", "then", "else", "elif", "fi", "for", "while", "do", "done", "case", "esac", "function", "return", "export", "local"],
-                operators=["-eq", "-ne", "-lt", "-gt", "-le", "-ge", "=", "!=", "&&", "||", "|", ">", "<", ">>"],
-                comment_syntax={"single": "#"},
-                string_syntax=["'", '"', "$'"],
-                related_languages=["Zsh", "Fish", "PowerShell"],
-            ),
-            "powershell": LanguageConfig(
-                name="powershell",
-                display_name="PowerShell",
-                file_extensions=[".ps1", ".psm1", ".psd1"],
-                paradigms=[LanguageParadigm.OBJECT_ORIENTED, LanguageParadigm.PROCEDURAL],
-                typing="dynamic",
-                compiled=False,
-                interpreted=True,
-                garbage_collected=True,
-                memory_safe=True,
-                year_created=2006,
-                creator="Microsoft",
-                description="Cross-platform task automation and configuration management. Built on .NET.",
-                use_cases=["Windows Administration", "Azure Automation", "DevOps", "Configuration Management"],
-                popular_frameworks=["PSScriptAnalyzer", "Pester", "PSReadLine"],
-                package_manager="PowerShell Gallery",
-                documentation_url="https://docs.microsoft.com/en-us/powershell/",
-                syntax_example='function Greet($name) {\n    "Hello, $name!"\n}',
-                hello_world='Write-Host "Hello, World!"',
-                keywords=["function", "param", "if", "else", "elseif", "switch", "foreach", "while", "do", "return", "try", "catch", "finally", "class"],
-                operators=["+", "-", "*", "/", "-eq", "-ne", "-lt", "-gt", "-and", "-or", "-not", "|", ">", ">>"],
-                comment_syntax={"single": "#", "multi_start": "<#", "multi_end": "#>"},
-                string_syntax=["'", '"', "@'", '@"'],
-                related_languages=["Bash", "C#", "Python"],
-            ),
-
-            # ─────────────────────────────────────────────────────────────
-            # DATABASE & QUERY LANGUAGES
-            # ─────────────────────────────────────────────────────────────
-            "sql": LanguageConfig(
-                name="sql",
-                display_name="SQL",
-                file_extensions=[".sql"],
-                paradigms=[LanguageParadigm.DECLARATIVE],
-                typing="static",
-                compiled=False,
-                interpreted=True,
-                garbage_collected=False,
-                memory_safe=True,
-                year_created=1974,
-                creator="IBM (Donald Chamberlin, Raymond Boyce)",
-                description="The language of databases. Query, manipulate, and manage relational data.",
-                use_cases=["Database Management", "Data Analysis", "Reporting", "ETL Pipelines"],
-                popular_frameworks=["PostgreSQL", "MySQL", "SQLite", "SQL Server", "Oracle"],
-                package_manager=None,
-                documentation_url="https://www.w3schools.com/sql/",
-                syntax_example='SELECT name FROM users WHERE age > 18 ORDER BY name;',
-                hello_world="SELECT 'Hello, World!' AS greeting;",
-                keywords=["SELECT", "FROM", "WHERE", "INSERT", "UPDATE", "DELETE", "CREATE", "ALTER", "DROP", "JOIN", "ON", "GROUP BY", "ORDER BY", "HAVING"],
-                operators=["=", "<>", "<", ">", "<=", ">=", "AND", "OR", "NOT", "IN", "BETWEEN", "LIKE", "IS NULL"],
-                comment_syntax={"single": "--", "multi_start": "/*", "multi_end": "*/"},
-                string_syntax=["'"],
-                related_languages=["PL/SQL", "T-SQL", "GraphQL"],
-            ),
-            "graphql": LanguageConfig(
-                name="graphql",
-                display_name="GraphQL",
-                file_extensions=[".graphql", ".gql"],
-                paradigms=[LanguageParadigm.DECLARATIVE],
-                typing="static",
-                compiled=False,
-                interpreted=True,
-                garbage_collected=False,
-                memory_safe=True,
-                year_created=2015,
-                creator="Facebook",
-                description="A query language for APIs. Request exactly the data you need.",
-                use_cases=["API Development", "Mobile Apps", "Web Apps"],
-                popular_frameworks=["Apollo", "Relay", "Hasura", "Prisma"],
-                package_manager=None,
-                documentation_url="https://graphql.org/learn/",
-                syntax_example='query GetUser($id: ID!) {\n  user(id: $id) {\n    name\n    email\n  }\n}',
-                hello_world='query {\n  hello\n}',
-                keywords=["query", "mutation", "subscription", "type", "input", "interface", "enum", "scalar", "fragment", "on"],
-                operators=["!", "...", "@"],
-                comment_syntax={"single": "#"},
-                string_syntax=['"'],
-                related_languages=["SQL", "JSON", "TypeScript"],
-            ),
-
-            # ─────────────────────────────────────────────────────────────
-            # SMART CONTRACTS
-            # ─────────────────────────────────────────────────────────────
-            "solidity": LanguageConfig(
-                name="solidity",
-                display_name="Solidity",
-                file_extensions=[".sol"],
-                paradigms=[LanguageParadigm.OBJECT_ORIENTED],
-                typing="static",
-                compiled=True,
-                interpreted=False,
-                garbage_collected=False,
-                memory_safe=False,
-                year_created=2014,
-                creator="Ethereum Foundation (Gavin Wood)",
-                description="The language of Ethereum. Write smart contracts that run on the blockchain.",
-                use_cases=["Smart Contracts", "DeFi", "NFTs", "DAOs"],
-                popular_frameworks=["Hardhat", "Foundry", "Truffle", "OpenZeppelin"],
-                package_manager="npm",
-                documentation_url="https://docs.soliditylang.org/",
-                syntax_example='function greet(string memory name) public pure returns (string memory) {\n    return string(abi.encodePacked("Hello, ", name, "!"));\n}',
-                hello_world='contract HelloWorld {\n    function hello() public pure returns (string memory) {\n        return "Hello, World!";\n    }\n}',
-                keywords=["contract", "function", "modifier", "event", "struct", "mapping", "public", "private", "external", "internal", "view", "pure", "payable", "memory", "storage"],
-                operators=["+", "-", "*", "/", "==", "!=", "&&", "||", "=>"],
-                comment_syntax={"single": "//", "multi_start": "/*", "multi_end": "*/"},
-                string_syntax=['"'],
-                related_languages=["JavaScript", "C++", "Vyper"],
-            ),
-
-            # ─────────────────────────────────────────────────────────────
-            # MODERN & EMERGING LANGUAGES
-            # ─────────────────────────────────────────────────────────────
-            "zig": LanguageConfig(
-                name="zig",
-                display_name="Zig",
-                file_extensions=[".zig"],
-                paradigms=[LanguageParadigm.PROCEDURAL, LanguageParadigm.IMPERATIVE],
-                typing="static",
-                compiled=True,
-                interpreted=False,
-                garbage_collected=False,
-                memory_safe=True,
-                year_created=2016,
-                creator="Andrew Kelley",
-                description="A better C. No hidden control flow, no garbage collection, and easy C/C++ interop.",
-                use_cases=["Systems Programming", "Game Development", "Embedded Systems"],
-                popular_frameworks=["None (systems language)"],
-                package_manager="Zig Package Manager",
-                documentation_url="https://ziglang.org/documentation/",
-                syntax_example='fn greet(name: []const u8) []const u8 {\n    // ...\n}',
-                hello_world='const std = @import("std");\npub fn main() void {\n    std.debug.print("Hello, World!\\n", .{});\n}',
-                keywords=["fn", "const", "var", "pub", "comptime", "if", "else", "while", "for", "return", "switch", "struct", "enum", "union"],
-                operators=["+", "-", "*", "/", "==", "!=", "and", "or", "orelse", "catch"],
-                comment_syntax={"single": "//"},
-                string_syntax=['"'],
-                related_languages=["C", "Rust", "Nim"],
-            ),
-            "mojo": LanguageConfig(
-                name="mojo",
-                display_name="Mojo",
-                file_extensions=[".mojo", ".🔥"],
-                paradigms=[LanguageParadigm.OBJECT_ORIENTED, LanguageParadigm.FUNCTIONAL],
-                typing="static",
-                compiled=True,
-                interpreted=False,
-                garbage_collected=True,
-                memory_safe=True,
-                year_created=2023,
-                creator="Modular (Chris Lattner)",
-                description="Python superset for AI/ML. Combines Python's usability with systems-level performance.",
-                use_cases=["AI/ML", "High Performance Computing", "Systems Programming"],
-                popular_frameworks=["Modular Engine"],
-                package_manager="Modular",
-                documentation_url="https://docs.modular.com/mojo/",
-                syntax_example='fn greet(name: String) -> String:\n    return "Hello, " + name + "!"',
-                hello_world='fn main():\n    print("Hello, World!")',
-                keywords=["fn", "def", "struct", "let", "var", "if", "else", "for", "while", "return", "alias", "trait", "inout", "owned", "borrowed"],
-                operators=["+", "-", "*", "/", "==", "!=", "and", "or", "not"],
-                comment_syntax={"single": "#"},
-                string_syntax=["'", '"'],
-                related_languages=["Python", "Rust", "Swift"],
-            ),
-        }
-
-    def _load_syntax_patterns(self) -> Dict[str, Dict[str, Any]]:
-        """Load regex patterns for syntax validation"""
-        return {
-            "python": {
-                "indent_error": r"^(\s*)(?!#).*\n(?!\1|\s*$)",
-                "syntax_errors": [
-                    (r"print\s+[^(]", "Missing parentheses in print (Python 3 syntax)"),
-                    (r"\bdef\s+\w+[^(]", "Function definition missing parentheses"),
-                    (r":\s*\n\s*\n", "Empty block after colon"),
-                ],
-                "common_mistakes": [
-                    (r"==\s*True", "Use 'if x:' instead of 'if x == True:'"),
-                    (r"==\s*False", "Use 'if not x:' instead of 'if x == False:'"),
-                    (r"==\s*None", "Use 'is None' instead of '== None'"),
-                    (r"except\s*:", "Bare except clause - specify exception type"),
-                ],
-            },
-            "javascript": {
-                "syntax_errors": [
-                    (r"function\s+\w+\s*[^(]", "Function missing parentheses"),
-                    (r"==(?!=)", "Use === for strict equality"),
-                    (r"!=(?!=)", "Use !== for strict inequality"),
-                ],
-                "common_mistakes": [
-                    (r"var\s+", "Consider using 'const' or 'let' instead of 'var'"),
-                    (r"==\s*null", "Use === null or == null carefully"),
-                ],
-            },
-            "java": {
-                "syntax_errors": [
-                    (r"System\.out\.print(?!ln|f)", "Use println() or printf() for output"),
-                    (r"public\s+class\s+\w+\s*[^{]", "Class definition missing opening brace"),
-                ],
-            },
-        }
-
-    def get_language_config(self, language: ProgrammingLanguage) -> Optional[LanguageConfig]:
+        self.languages = _LANGUAGES_VIEW
+        self.syntax_patterns = _SYNTAX_PATTERNS
+        # key -> (response, source length)
+        self._analysis_cache: "OrderedDict[Tuple, Tuple[CodeAnalysisResponse, int]]" = OrderedDict()
+        self._analysis_cache_length = 0
+        # key -> (pass result, source length)
+        self._pass_cache: "OrderedDict[Tuple, Tuple[Any, int]]" = OrderedDict()
+        self._pass_cache_length = 0
+
+    def get_language_config(self, language: ProgrammingLanguage) -> Optional[LanguageConfigLite]:
         """Get configuration for a specific language"""
         return self.languages.get(language.value)
 
-    def get_all_languages(self) -> List[LanguageConfig]:
-        """Get all supported language configurations"""
-        return list(self.languages.values())
+    def get_all_languages(self) -> Sequence[LanguageConfigLite]:
+        """Get all supported language configurations (a shared, read-only tuple)"""
+        return _ALL_LANGUAGES
 
     def detect_language(self, code: str, filename: Optional[str] = None) -> ProgrammingLanguage:
         """Detect the programming language from code or filename"""
         # Check by file extension first
-        if filename:
-            ext = "." + filename.split(".")[-1].lower() if "." in filename else ""
-            for lang_name, config in self.languages.items():
-                if ext in config.file_extensions:
-                    return ProgrammingLanguage(lang_name)
+        if filename and "." in filename:
+            lang = _EXT_TO_LANG.get(filename[filename.rfind("."):].lower())
+            if lang is not None:
+                return lang
 
         # Heuristic detection based on code patterns
-        patterns = {
-            ProgrammingLanguage.PYTHON: [r"\bdef\s+\w+\s*\(", r"\bimport\s+\w+", r"print\s*\(", r":\s*$"],
-            ProgrammingLanguage.JAVASCRIPT: [r"\bconst\s+\w+\s*=", r"\blet\s+\w+\s*=", r"console\.log", r"function\s*\w*\s*\(", r"=>"],
-            ProgrammingLanguage.TYPESCRIPT: [r":\s*(string|number|boolean|void)", r"interface\s+\w+", r"type\s+\w+\s*="],
-            ProgrammingLanguage.JAVA: [r"public\s+class", r"System\.out\.print", r"public\s+static\s+void\s+main"],
-            ProgrammingLanguage.CSHARP: [r"using\s+System", r"Console\.Write", r"namespace\s+\w+"],
-            ProgrammingLanguage.CPP: [r"#include\s*<", r"std::", r"cout\s*<<", r"int\s+main\s*\("],
-            ProgrammingLanguage.C: [r"#include\s*<stdio\.h>", r"printf\s*\(", r"int\s+main\s*\("],
-            ProgrammingLanguage.GO: [r"package\s+main", r"func\s+\w+\s*\(", r"fmt\.Print"],
-            ProgrammingLanguage.RUST: [r"fn\s+main\s*\(", r"let\s+mut", r"println!\s*\(", r"impl\s+\w+"],
-            ProgrammingLanguage.RUBY: [r"\bdef\s+\w+", r"puts\s+", r"end$", r"attr_accessor"],
-            ProgrammingLanguage.PHP: [r"<\?php", r"\$\w+\s*=", r"echo\s+"],
-            ProgrammingLanguage.SWIFT: [r"\bfunc\s+\w+\s*\(", r"var\s+\w+:", r"let\s+\w+:", r"print\s*\("],
-            ProgrammingLanguage.KOTLIN: [r"fun\s+main\s*\(", r"fun\s+\w+\s*\(", r"val\s+\w+", r"println\s*\("],
-            ProgrammingLanguage.SQL: [r"\bSELECT\b", r"\bFROM\b", r"\bWHERE\b", r"\bINSERT\b", r"\bUPDATE\b"],
-            ProgrammingLanguage.HTML: [r"<html", r"<div", r"<body", r"</\w+>"],
-            ProgrammingLanguage.CSS: [r"\{[^}]*:\s*[^}]+;[^}]*\}", r"@media", r"\.[\w-]+\s*\{"],
-            ProgrammingLanguage.BASH: [r"#!/bin/bash", r"\becho\s+", r"\bif\s+\[", r"\bdone$"],
-            ProgrammingLanguage.HASKELL: [r"::\s*\w+\s*->", r"\bwhere$", r"\bdo$", r"import\s+qualified"],
-            ProgrammingLanguage.ELIXIR: [r"defmodule\s+\w+", r"\bdef\s+\w+", r"\|>", r"iex>"],
-            ProgrammingLanguage.SOLIDITY: [r"pragma\s+solidity", r"contract\s+\w+", r"function\s+\w+.*public"],
-        }
-
-        scores = {lang: 0 for lang in patterns}
-        for lang, regexes in patterns.items():
-            for regex in regexes:
-                if re.search(regex, code, re.MULTILINE | re.IGNORECASE):
+        scores = {lang: 0 for lang in _DETECT_PATTERNS}
+        for regex, langs in _DETECT_RULES:
+            if regex.search(code):
+                for lang in langs:
                     scores[lang] += 1
 
         # Return language with highest score, default to Python
@@ -866,10 +1071,33 @@ class CodeAnalyzer:
         """
         Perform comprehensive code analysis
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+
+        cache_key = None
+        digest = None
+        # Without a digest neither the response nor any pass is cached
+        if ANALYSIS_CACHE_MIN_LENGTH <= len(code) <= ANALYSIS_CACHE_MAX_LENGTH:
+            digest = hashlib.blake2b(code.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+            cache_key = (
+                language, digest, analyze_errors, analyze_style, analyze_complexity,
+                suggest_improvements, explain_code, trace_execution,
+            )
+            cached = self._analysis_cache.get(cache_key)
+            if cached is not None:
+                self._analysis_cache.move_to_end(cache_key)
+                update: Dict[str, Any] = {}
+                if trace_execution:
+                    # Traces are the bulkiest part of a response, so they aren't cached
+                    stripped = [line.strip() for line in _split_source_lines(code)]
+                    update["execution_trace"] = [
+                        step.to_model() for step in self._trace_execution(stripped, language)
+                    ]
+                update["analysis_time_ms"] = (time.perf_counter_ns() - start_ns) / 1e6
+                # Deep copy: callers own their response, including its lists
+                return cached[0].model_copy(update=update, deep=True)
 
-        errors: List[CodeError] = []
-        warnings: List[CodeError] = []
+        errors: List[_ErrorRec] = []
+        warnings: List[_ErrorRec] = []
         suggestions: List[str] = []
         metrics = None
         explanation = None
@@ -879,54 +1107,139 @@ class CodeAnalyzer:
         # Get language config
         config = self.get_language_config(language)
 
-        if analyze_errors:
-            errors, warnings = self._check_syntax(code, language)
+        # Split and measure the lines once for every line-based pass below,
+        # and only if one of them actually runs
+        line_data: Optional[Tuple[List[str], List[str], List[int]]] = None
+
+        def split_lines() -> Tuple[List[str], List[str], List[int]]:
+            nonlocal line_data
+            if line_data is None:
+                lines = _split_source_lines(code)
+                line_data = (lines, [line.strip() for line in lines], [len(line) for line in lines])
+            return line_data
+
+        if analyze_errors and language.value in _SYNTAX_LANGUAGES:
+            found_errors, found_warnings = self._cached_pass(
+                "syntax", language, digest, len(code),
+                lambda: tuple(map(tuple, self._check_syntax(code, language))),
+            )
+            errors, warnings = list(found_errors), list(found_warnings)
 
         if analyze_style:
-            style_issues = self._check_style(code, language)
+            def check_style() -> Tuple[_ErrorRec, ...]:
+                if len(code) >= STYLE_VECTORIZE_MIN_LENGTH and code.isascii():
+                    return tuple(self._check_style_vectorized(code, language))
+                lines, _, lengths = split_lines()
+                return tuple(self._check_style(lines, lengths, language))
+
+            style_issues = self._cached_pass("style", language, digest, len(code), check_style)
             warnings.extend(style_issues)
 
         if analyze_complexity:
-            metrics = self._calculate_metrics(code, language)
+            # The pass caches plain field values; each response gets its own model
+            def metric_values() -> Mapping[str, Any]:
+                _, stripped, lengths = split_lines()
+                metrics = self._calculate_metrics(code, stripped, lengths, language)
+                return MappingProxyType(metrics.model_dump())
+
+            metrics = CodeMetrics(
+                **self._cached_pass("metrics", language, digest, len(code), metric_values)
+            )
 
         if suggest_improvements:
             suggestions = self._generate_suggestions(code, language, errors, warnings)
 
         if explain_code:
-            explanation = self._explain_code(code, language)
+            explanation = self._explain_code(split_lines()[1], language)
 
         if trace_execution:
-            execution_trace = self._trace_execution(code, language)
+            # Steps are converted as they are produced, so only the response list is held
+            execution_trace = [
+                step.to_model() for step in self._trace_execution(split_lines()[1], language)
+            ]
 
         # Determine validity
         is_valid = len([e for e in errors if e.severity == "error"]) == 0
 
-        return CodeAnalysisResponse(
+        response = CodeAnalysisResponse(
             language=language,
             language_version=None,
             is_valid=is_valid,
-            errors=errors,
-            warnings=warnings,
+            errors=[error.to_model() for error in errors],
+            warnings=[warning.to_model() for warning in warnings],
             suggestions=suggestions,
             metrics=metrics,
             explanation=explanation,
             execution_trace=execution_trace,
             improved_code=improved_code,
-            analysis_time_ms=(time.time() - start_time) * 1000,
+            analysis_time_ms=(time.perf_counter_ns() - start_ns) / 1e6,
         )
 
-    def _check_syntax(self, code: str, language: ProgrammingLanguage) -> Tuple[List[CodeError], List[CodeError]]:
+        if cache_key is not None:
+            # Keep a private copy so the caller can't alter what later hits see
+            stored = response.model_copy(update={"execution_trace": None}, deep=True)
+            self._analysis_cache[cache_key] = (stored, len(code))
+            self._analysis_cache_length += len(code)
+            while (
+                len(self._analysis_cache) > ANALYSIS_CACHE_SIZE
+                or self._analysis_cache_length > ANALYSIS_CACHE_MAX_TOTAL_LENGTH
+            ):
+                _, (_, length) = self._analysis_cache.popitem(last=False)
+                self._analysis_cache_length -= length
+
+        return response
+
+    def _cached_pass(
+        self,
+        name: str,
+        language: ProgrammingLanguage,
+        digest: Optional[bytes],
+        length: int,
+        compute: Callable[[], Any],
+    ) -> Any:
+        """Return a memoized pass result, computing it on a miss (or always, without a digest)"""
+        if digest is None:
+            return compute()
+
+        key = (name, language, digest)
+        cached = self._pass_cache.get(key)
+        if cached is not None:
+            self._pass_cache.move_to_end(key)
+            return cached[0]
+
+        result = compute()
+        self._pass_cache[key] = (result, length)
+        self._pass_cache_length += length
+        while (
+            len(self._pass_cache) > PASS_CACHE_SIZE
+            or self._pass_cache_length > PASS_CACHE_MAX_TOTAL_LENGTH
+        ):
+            _, (_, evicted) = self._pass_cache.popitem(last=False)
+            self._pass_cache_length -= evicted
+        return result
+
+    def _check_syntax(self, code: str, language: ProgrammingLanguage) -> Tuple[List[_ErrorRec], List[_ErrorRec]]:
         """Check for syntax errors"""
+        lang_patterns = self.syntax_patterns.get(language.value)
+        if not lang_patterns:
+            return [], []
+
         errors = []
         warnings = []
+        add_error = errors.append
+        add_warning = warnings.append
+        record = _ErrorRec
+        line_index = bisect_left
 
-        lang_patterns = self.syntax_patterns.get(language.value, {})
+        # Newline offsets, so a match's line number is a binary search rather
+        # than a slice-and-count of everything before it
+        newlines = [m.start() for m in _NEWLINE_REGEX.finditer(code)]
 
         # Check for known syntax errors
         for pattern, message in lang_patterns.get("syntax_errors", []):
-            for match in re.finditer(pattern, code, re.MULTILINE):
-                line_num = code[:match.start()].count('\n') + 1
-                errors.append(CodeError(
+            for match in pattern.finditer(code):
+                line_num = line_index(newlines, match.start()) + 1
+                add_error(record(
                     line=line_num,
                     error_type="syntax",
                     severity="error",
@@ -936,9 +1249,9 @@ class CodeAnalyzer:
 
         # Check for common mistakes
         for pattern, message in lang_patterns.get("common_mistakes", []):
-            for match in re.finditer(pattern, code, re.MULTILINE):
-                line_num = code[:match.start()].count('\n') + 1
-                warnings.append(CodeError(
+            for match in pattern.finditer(code):
+                line_num = line_index(newlines, match.start()) + 1
+                add_warning(record(
                     line=line_num,
                     error_type="style",
                     severity="warning",
@@ -949,24 +1262,30 @@ class CodeAnalyzer:
 
         return errors, warnings
 
-    def _check_style(self, code: str, language: ProgrammingLanguage) -> List[CodeError]:
+    def _check_style(
+        self,
+        lines: List[str],
+        lengths: List[int],
+        language: ProgrammingLanguage,
+    ) -> List[_ErrorRec]:
         """Check code style issues"""
         issues = []
-        lines = code.split('\n')
+        add_issue = issues.append
+        record = _ErrorRec
 
-        for i, line in enumerate(lines, 1):
+        for i, (line, length) in enumerate(zip(lines, lengths), 1):
             # Line too long
-            if len(line) > 120:
-                issues.append(CodeError(
+            if length > 120:
+                add_issue(record(
                     line=i,
                     error_type="style",
                     severity="info",
-                    message=f"Line exceeds 120 characters ({len(line)} chars)",
+                    message=f"Line exceeds 120 characters ({length} chars)",
                 ))
 
-            # Trailing whitespace
-            if line != line.rstrip():
-                issues.append(CodeError(
+            # Trailing whitespace; rstrip() removes exactly the characters isspace() accepts
+            if line[-1:].isspace():
+                add_issue(record(
                     line=i,
                     error_type="style",
                     severity="info",
@@ -975,33 +1294,75 @@ class CodeAnalyzer:
 
         return issues
 
-    def _calculate_metrics(self, code: str, language: ProgrammingLanguage) -> CodeMetrics:
+    def _check_style_vectorized(self, code: str, language: ProgrammingLanguage) -> List[_ErrorRec]:
+        """
+        Same checks as _check_style for large ASCII sources, with the same
+        line split, finding the flagged lines with NumPy instead of a loop
+        """
+        buf = np.frombuffer(code.encode("ascii"), dtype=np.uint8)
+        newlines = np.flatnonzero(buf == ord("\n"))
+        starts = np.concatenate(([0], newlines + 1))
+        ends = np.concatenate((newlines, [len(buf)]))
+        if ends[-1] == starts[-1]:
+            # A final line break doesn't open an empty line
+            starts, ends = starts[:-1], ends[:-1]
+        # Drop one trailing "\r" per line
+        ends = ends - ((ends > starts) & (buf[np.maximum(ends - 1, 0)] == ord("\r")))
+
+        lengths = ends - starts
+        too_long = lengths > 120
+        trailing = (lengths > 0) & np.isin(buf[np.maximum(ends - 1, 0)], _TRAILING_SPACE_BYTES)
+
+        issues = []
+        add_issue = issues.append
+        record = _ErrorRec
+        for index in np.flatnonzero(too_long | trailing).tolist():
+            line = index + 1
+            if too_long[index]:
+                add_issue(record(
+                    line=line,
+                    error_type="style",
+                    severity="info",
+                    message=f"Line exceeds 120 characters ({int(lengths[index])} chars)",
+                ))
+            if trailing[index]:
+                add_issue(record(
+                    line=line,
+                    error_type="style",
+                    severity="info",
+                    message="Trailing whitespace",
+                ))
+
+        return issues
+
+    def _calculate_metrics(
+        self,
+        code: str,
+        stripped: List[str],
+        lengths: List[int],
+        language: ProgrammingLanguage,
+    ) -> CodeMetrics:
         """Calculate code quality metrics"""
-        lines = code.split('\n')
-        non_empty_lines = [l for l in lines if l.strip()]
-        comment_lines = sum(1 for l in lines if l.strip().startswith(('#', '//', '--', '/*', '*')))
+        non_empty_lengths = [length for s, length in zip(stripped, lengths) if s]
 
         # Simple cyclomatic complexity estimation
-        complexity_patterns = ['if', 'elif', 'else', 'for', 'while', 'case', 'catch', 'except', '&&', '||', '?']
-        complexity = 1
-        for pattern in complexity_patterns:
-            complexity += code.count(pattern)
+        complexity = 1 + len(_COMPLEXITY_REGEX.findall(code))
 
         return CodeMetrics(
-            lines_of_code=len(non_empty_lines),
+            lines_of_code=len(non_empty_lengths),
             cyclomatic_complexity=complexity,
-            cognitive_complexity=complexity + len(non_empty_lines) // 20,
-            maintainability_index=max(0, 171 - 5.2 * (len(non_empty_lines) / 100) - 0.23 * complexity),
+            cognitive_complexity=complexity + len(non_empty_lengths) // 20,
+            maintainability_index=max(0, 171 - 5.2 * (len(non_empty_lengths) / 100) - 0.23 * complexity),
             duplicate_lines=0,
-            code_smells=len([l for l in non_empty_lines if len(l) > 100]),
+            code_smells=sum(1 for length in non_empty_lengths if length > 100),
         )
 
     def _generate_suggestions(
         self,
         code: str,
         language: ProgrammingLanguage,
-        errors: List[CodeError],
-        warnings: List[CodeError]
+        errors: List[_ErrorRec],
+        warnings: List[_ErrorRec]
     ) -> List[str]:
         """Generate improvement suggestions"""
         suggestions = []
@@ -1010,62 +1371,54 @@ class CodeAnalyzer:
         config = self.get_language_config(language)
 
         if config:
+            needles = _SUGGESTION_NEEDLES.get(language)
+            found = set(needles.findall(code)) if needles else set()
+
             # Add general best practices
             if language == ProgrammingLanguage.PYTHON:
-                if "import *" in code:
+                if "import *" in found:
                     suggestions.append("Avoid 'import *' - use explicit imports")
-                if not code.strip().startswith(('"""', "'''", "#")):
+                if not _PY_MODULE_HEADER.match(code):
                     suggestions.append("Consider adding a module docstring")
 
             elif language == ProgrammingLanguage.JAVASCRIPT:
-                if "var " in code:
+                if "var " in found:
                     suggestions.append("Use 'const' or 'let' instead of 'var'")
-                if "==" in code and "===" not in code:
+                if "==" in found and "===" not in found:
                     suggestions.append("Use strict equality (===) instead of ==")
 
             elif language == ProgrammingLanguage.JAVA:
-                if "System.out.print" in code and "System.out.println" not in code:
+                if "System.out.print" in found and "System.out.println" not in found:
                     suggestions.append("Use println() for better output formatting")
 
         return suggestions
 
-    def _explain_code(self, code: str, language: ProgrammingLanguage) -> str:
+    def _explain_code(self, stripped: List[str], language: ProgrammingLanguage) -> str:
         """Generate a human-readable explanation of the code"""
-        config = self.get_language_config(language)
-        lines = code.split('\n')
-
-        explanation_parts = [
-            f"This is {config.display_name} code.",
-            f"",
-            f"Language Info:",
-            f"- Paradigms: {', '.join([p.value for p in config.paradigms])}",
-            f"- Typing: {config.typing}",
-            f"- Memory managed: {'Yes (GC)' if config.garbage_collected else 'Manual'}",
-            f"",
-            f"Code Structure:",
-            f"- Total lines: {len(lines)}",
-            f"- Non-empty lines: {len([l for l in lines if l.strip()])}",
-        ]
-
-        return '\n'.join(explanation_parts)
-
-    def _trace_execution(self, code: str, language: ProgrammingLanguage) -> List[ExecutionStep]:
-        """Generate step-by-step execution trace"""
+        prefix = _EXPLAIN_PREFIXES[language.value]
+        non_empty = len(stripped) - stripped.count("")
+        return f"{prefix}- Total lines: {len(stripped)}\n- Non-empty lines: {non_empty}"
+
+    def _trace_execution(
+        self,
+        stripped: List[str],
+        language: ProgrammingLanguage,
+    ) -> Iterator[_StepRec]:
+        """Generate step-by-step execution trace, one step at a time"""
         # Simplified trace - in production, use AST parsing
-        steps = []
-        lines = code.split('\n')
+        record = _StepRec
+        count = 0
 
-        for i, line in enumerate(lines, 1):
-            if line.strip() and not line.strip().startswith(('#', '//', '--')):
-                steps.append(ExecutionStep(
-                    step_number=len(steps) + 1,
+        for i, line in enumerate(stripped, 1):
+            if line and not line.startswith(('#', '//', '--')):
+                count += 1
+                operation = line[:50]
+                yield record(
+                    step_number=count,
                     line=i,
-                    operation=line.strip()[:50],
-                    variables={},
-                    explanation=f"Execute: {line.strip()[:50]}",
-                ))
-
-        return steps
+                    operation=operation,
+                    explanation=f"Execute: {operation}",
+                )
 
 
 # Create singleton instance
@@ -9,11 +9,13 @@ Like 2048, but for your brain:
 - Keep learning to avoid game over
 """
 
-import uuid
+import asyncio
 import random
-from typing import Dict, List, Optional, Tuple
+import secrets
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
 from datetime import datetime
-from copy import deepcopy
 
 from models.memory import (
     MemoryTile, MemoryGrid, MergeEvent, MoveDirection, LearnEvent,
@@ -21,6 +23,75 @@ from models.memory import (
     get_merged_concept, generate_merge_insight,
     TILE_TO_MASTERY, MASTERY_DESCRIPTIONS,
 )
+from ._move_kernels import line_plan
+from .memory_store import MemoryStore, InProcessStore
+
+
+# Starter concepts for new tiles, per domain
+_CONCEPTS: Dict[KnowledgeDomain, Tuple[str, ...]] = {
+    KnowledgeDomain.PYTHON: (
+        "variables", "strings", "lists", "dicts", "loops", "functions",
+        "classes", "imports", "exceptions", "decorators", "generators",
+        "comprehensions", "lambda", "async", "typing", "dataclasses"
+    ),
+    KnowledgeDomain.JAVASCRIPT: (
+        "variables", "functions", "objects", "arrays", "promises",
+        "async-await", "dom", "events", "classes", "modules",
+        "closures", "prototypes", "this", "arrow-functions", "spread"
+    ),
+    KnowledgeDomain.ALGORITHMS: (
+        "big-o", "arrays", "sorting", "searching", "recursion",
+        "trees", "graphs", "dp", "greedy", "backtracking",
+        "binary-search", "two-pointers", "sliding-window", "hash-maps"
+    ),
+    KnowledgeDomain.MATHEMATICS: (
+        "algebra", "equations", "functions", "graphs", "calculus",
+        "derivatives", "integrals", "limits", "geometry", "trigonometry",
+        "statistics", "probability", "matrices", "vectors"
+    ),
+    KnowledgeDomain.DATA_STRUCTURES: (
+        "arrays", "linked-lists", "stacks", "queues", "trees",
+        "heaps", "hash-tables", "graphs", "tries", "sets"
+    ),
+}
+_DEFAULT_CONCEPTS = ("concept",)
+
+# Level suffix by tile value: <=4 basics, <=16 intermediate, <=64 advanced, else expert
+_LEVEL_BOUNDS = (4, 16, 64)
+_LEVEL_SUFFIXES = (":basics", ":intermediate", ":advanced", ":expert")
+
+# Characters per cell in render_grid_ascii
+ASCII_CELL_WIDTH = 8
+
+
+@lru_cache(maxsize=32)
+def _grid_borders(size: int, cell_width: int) -> Tuple[str, str, str]:
+    """Top, between-rows and bottom border lines for an ASCII grid"""
+    bar = "─" * cell_width
+
+    def line(left: str, middle: str, right: str) -> str:
+        return left + middle.join([bar] * size) + right
+
+    return line("┌", "┬", "┐"), line("├", "┼", "┤"), line("└", "┴", "┘")
+
+
+@lru_cache(maxsize=64)
+def _line_cells(size: int, direction: MoveDirection) -> Tuple[Tuple[Tuple[int, int], ...], ...]:
+    """
+    Cell positions of every row (LEFT/RIGHT) or column (UP/DOWN), each listed
+    in the direction of travel. Built once per grid size instead of per row
+    per move.
+    """
+    span = range(size)
+    if direction == MoveDirection.LEFT:
+        return tuple(tuple((i, j) for j in span) for i in span)
+    if direction == MoveDirection.RIGHT:
+        return tuple(tuple((i, j) for j in reversed(span)) for i in span)
+    if direction == MoveDirection.UP:
+        return tuple(tuple((j, i) for j in span) for i in span)
+    if direction == MoveDirection.DOWN:
+        return tuple(tuple((j, i) for j in reversed(span)) for i in span)
+    return ()
 
 
 class MemoryEngine:
@@ -29,11 +100,12 @@ class MemoryEngine:
     Manages knowledge grids, tile movements, and merges.
     """
 
-    def __init__(self):
-        # In-memory storage (replace with database in production)
-        self.grids: Dict[str, Dict[KnowledgeDomain, MemoryGrid]] = {}
-        self.stats: Dict[str, MemoryStats] = {}
-        self.merge_history: List[MergeEvent] = []
+    def __init__(self, store: Optional[MemoryStore] = None, seed: Optional[int] = None):
+        # Grids, stats and merge history live in the store (in-process by default)
+        self.store: MemoryStore = store if store is not None else InProcessStore()
+        # Own generator rather than the shared module-level one; pass a seed to
+        # replay games deterministically
+        self._rng = random.Random(seed)
 
     def _get_grid_key(self, user_id: str, domain: KnowledgeDomain) -> str:
         """Generate a unique key for a user's domain grid"""
@@ -46,10 +118,9 @@ class MemoryEngine:
         size: int = 4
     ) -> MemoryGrid:
         """Get existing grid or create a new one"""
-        if user_id not in self.grids:
-            self.grids[user_id] = {}
+        grid = self.store.get_grids(user_id).get(domain)
 
-        if domain not in self.grids[user_id]:
+        if grid is None:
             # Create new grid with 2 starting tiles
             grid = MemoryGrid(
                 user_id=user_id,
@@ -59,42 +130,46 @@ class MemoryEngine:
                 score=0,
             )
             # Add 2 initial tiles
-            self._add_random_tile(grid)
-            self._add_random_tile(grid)
-            self.grids[user_id][domain] = grid
+            now = datetime.utcnow()
+            self._add_random_tile(grid, now=now)
+            self._add_random_tile(grid, now=now)
+            self.store.put_grid(grid)
 
-        return self.grids[user_id][domain]
+        return grid
 
     def _add_random_tile(
         self,
         grid: MemoryGrid,
         concept: Optional[str] = None,
-        value: Optional[int] = None
+        value: Optional[int] = None,
+        now: Optional[datetime] = None
     ) -> Optional[MemoryTile]:
         """Add a random tile to an empty cell"""
-        empty_cells = grid.empty_cells
+        empty_cells = grid._occupancy.free
         if not empty_cells:
             return None
 
-        position = random.choice(empty_cells)
+        position = empty_cells[self._rng.randrange(len(empty_cells))]
 
         # Value: 90% chance of 2, 10% chance of 4
         if value is None:
-            value = 2 if random.random() < 0.9 else 4
+            value = 2 if self._rng.random() < 0.9 else 4
 
         # Generate concept name if not provided
         if concept is None:
             concept = self._generate_concept_name(grid.domain, value)
 
         tile = MemoryTile(
-            id=str(uuid.uuid4()),
+            id=secrets.token_hex(8),
             value=value,
             concept=concept,
             domain=grid.domain,
             position=position,
+            created_at=now or datetime.utcnow(),
         )
 
         grid.tiles.append(tile)
+        grid._occupancy.place(tile)
 
         # Update highest tile
         if value > grid.highest_tile:
@@ -104,45 +179,10 @@ class MemoryEngine:
 
     def _generate_concept_name(self, domain: KnowledgeDomain, value: int) -> str:
         """Generate a concept name based on domain and value"""
-        concepts = {
-            KnowledgeDomain.PYTHON: [
-                "variables", "strings", "lists", "dicts", "loops", "functions",
-                "classes", "imports", "exceptions", "decorators", "generators",
-                "comprehensions", "lambda", "async", "typing", "dataclasses"
-            ],
-            KnowledgeDomain.JAVASCRIPT: [
-                "variables", "functions", "objects", "arrays", "promises",
-                "async-await", "dom", "events", "classes", "modules",
-                "closures", "prototypes", "this", "arrow-functions", "spread"
-            ],
-            KnowledgeDomain.ALGORITHMS: [
-                "big-o", "arrays", "sorting", "searching", "recursion",
-                "trees", "graphs", "dp", "greedy", "backtracking",
-                "binary-search", "two-pointers", "sliding-window", "hash-maps"
-            ],
-            KnowledgeDomain.MATHEMATICS: [
-                "algebra", "equations", "functions", "graphs", "calculus",
-                "derivatives", "integrals", "limits", "geometry", "trigonometry",
-                "statistics", "probability", "matrices", "vectors"
-            ],
-            KnowledgeDomain.DATA_STRUCTURES: [
-                "arrays", "linked-lists", "stacks", "queues", "trees",
-                "heaps", "hash-tables", "graphs", "tries", "sets"
-            ],
-        }
-
-        domain_concepts = concepts.get(domain, ["concept"])
-        base_concept = random.choice(domain_concepts)
+        base_concept = self._rng.choice(_CONCEPTS.get(domain, _DEFAULT_CONCEPTS))
 
         # Add level indicator based on value
-        if value <= 4:
-            return f"{base_concept}:basics"
-        elif value <= 16:
-            return f"{base_concept}:intermediate"
-        elif value <= 64:
-            return f"{base_concept}:advanced"
-        else:
-            return f"{base_concept}:expert"
+        return base_concept + _LEVEL_SUFFIXES[bisect_left(_LEVEL_BOUNDS, value)]
 
     def move(
         self,
@@ -159,39 +199,18 @@ class MemoryEngine:
         if grid.game_over:
             return grid, [], None
 
-        # Store original state to check if anything moved
-        original_positions = {tile.id: tile.position for tile in grid.tiles}
-        original_values = {tile.id: tile.value for tile in grid.tiles}
+        # One timestamp for everything this move touches
+        now = datetime.utcnow()
 
-        merge_events = []
+        merge_events, moved = self._slide(grid, direction, now)
+        grid._drop_absorbed()
 
-        # Process movement based on direction
-        if direction == MoveDirection.LEFT:
-            merge_events = self._move_left(grid)
-        elif direction == MoveDirection.RIGHT:
-            merge_events = self._move_right(grid)
-        elif direction == MoveDirection.UP:
-            merge_events = self._move_up(grid)
-        elif direction == MoveDirection.DOWN:
-            merge_events = self._move_down(grid)
-
-        # Check if anything actually moved or merged
-        moved = False
-        for tile in grid.tiles:
-            if tile.id in original_positions:
-                if tile.position != original_positions[tile.id]:
-                    moved = True
-                    break
-                if tile.value != original_values.get(tile.id, tile.value):
-                    moved = True
-                    break
-
-        # Add new tile if something moved
+        # Add new tile if something moved or merged
         new_tile = None
-        if moved or merge_events:
+        if moved:
             grid.moves += 1
-            grid.last_move = datetime.utcnow()
-            new_tile = self._add_random_tile(grid)
+            grid.last_move = now
+            new_tile = self._add_random_tile(grid, now=now)
 
         # Check for 2048 win
         if any(tile.value >= 2048 for tile in grid.tiles):
@@ -201,168 +220,70 @@ class MemoryEngine:
         if not self._has_valid_moves(grid):
             grid.game_over = True
 
-        # Update stats
-        self._update_stats(user_id, grid, merge_events)
-
-        return grid, merge_events, new_tile
-
-    def _move_left(self, grid: MemoryGrid) -> List[MergeEvent]:
-        """Move all tiles left and merge"""
-        merge_events = []
-
-        for row in range(grid.size):
-            # Get tiles in this row, sorted by column
-            row_tiles = sorted(
-                [t for t in grid.tiles if t.position[0] == row],
-                key=lambda t: t.position[1]
-            )
-
-            # Process tiles from left to right
-            target_col = 0
-            merged_this_move = set()
-
-            for tile in row_tiles:
-                # Find the leftmost position this tile can move to
-                while target_col < tile.position[1]:
-                    # Check if there's a tile at target position
-                    existing = self._get_tile_at(grid, row, target_col)
-
-                    if existing is None:
-                        # Empty cell - move here
-                        tile.position = (row, target_col)
-                        break
-                    elif (existing.value == tile.value and
-                          existing.id not in merged_this_move and
-                          tile.id not in merged_this_move):
-                        # Can merge!
-                        merge_event = self._merge_tiles(grid, existing, tile)
-                        merge_events.append(merge_event)
-                        merged_this_move.add(existing.id)
-                        break
-                    else:
-                        # Can't merge - try next column
-                        target_col += 1
-
-                if target_col >= grid.size:
-                    break
-
-                target_col += 1
-
-        return merge_events
-
-    def _move_right(self, grid: MemoryGrid) -> List[MergeEvent]:
-        """Move all tiles right and merge"""
-        merge_events = []
-
-        for row in range(grid.size):
-            # Get tiles in this row, sorted by column (reverse)
-            row_tiles = sorted(
-                [t for t in grid.tiles if t.position[0] == row],
-                key=lambda t: t.position[1],
-                reverse=True
-            )
+        self.store.put_grid(grid)
 
-            target_col = grid.size - 1
-            merged_this_move = set()
-
-            for tile in row_tiles:
-                while target_col > tile.position[1]:
-                    existing = self._get_tile_at(grid, row, target_col)
-
-                    if existing is None:
-                        tile.position = (row, target_col)
-                        break
-                    elif (existing.value == tile.value and
-                          existing.id not in merged_this_move and
-                          tile.id not in merged_this_move):
-                        merge_event = self._merge_tiles(grid, existing, tile)
-                        merge_events.append(merge_event)
-                        merged_this_move.add(existing.id)
-                        break
-                    else:
-                        target_col -= 1
-
-                if target_col < 0:
-                    break
-
-                target_col -= 1
+        # Update stats. Inside a running event loop (the API handlers) this is
+        # deferred until after the response is built; callbacks run in order on
+        # the loop's thread, so stats still see every move in sequence.
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._update_stats(user_id, grid, merge_events, now)
+        else:
+            loop.call_soon(self._update_stats, user_id, grid, merge_events, now)
 
-        return merge_events
+        return grid, merge_events, new_tile
 
-    def _move_up(self, grid: MemoryGrid) -> List[MergeEvent]:
-        """Move all tiles up and merge"""
+    def _slide(
+        self,
+        grid: MemoryGrid,
+        direction: MoveDirection,
+        now: datetime
+    ) -> Tuple[List[MergeEvent], bool]:
+        """
+        Move all tiles in a direction and merge, one row or column at a time.
+        Lines are disjoint, so each one reads its tiles straight from the
+        position index before it slides.
+        """
+        at = grid._occupancy.at
         merge_events = []
+        moved = False
+        for cells in _line_cells(grid.size, direction):
+            tiles = [at.get(cell) for cell in cells]
+            events, line_moved = self._slide_line(grid, cells, tiles, now)
+            merge_events.extend(events)
+            moved = moved or line_moved
+        return merge_events, moved
+
+    def _slide_line(
+        self,
+        grid: MemoryGrid,
+        cells: Sequence[Tuple[int, int]],
+        line: Sequence[Optional[MemoryTile]],
+        now: datetime
+    ) -> Tuple[List[MergeEvent], bool]:
+        """
+        Slide one row or column towards cells[0] and merge.
+        cells lists the line's positions in the direction of travel and line
+        the tiles at those positions before the move.
+        Returns the merge events and whether any tile moved or merged.
+        """
+        occupancy = grid._occupancy
+        index = occupancy.at
+        plan = line_plan(tuple(tile.value if tile else 0 for tile in line))
 
-        for col in range(grid.size):
-            col_tiles = sorted(
-                [t for t in grid.tiles if t.position[1] == col],
-                key=lambda t: t.position[0]
-            )
-
-            target_row = 0
-            merged_this_move = set()
-
-            for tile in col_tiles:
-                while target_row < tile.position[0]:
-                    existing = self._get_tile_at(grid, target_row, col)
-
-                    if existing is None:
-                        tile.position = (target_row, col)
-                        break
-                    elif (existing.value == tile.value and
-                          existing.id not in merged_this_move and
-                          tile.id not in merged_this_move):
-                        merge_event = self._merge_tiles(grid, existing, tile)
-                        merge_events.append(merge_event)
-                        merged_this_move.add(existing.id)
-                        break
-                    else:
-                        target_row += 1
-
-                if target_row >= grid.size:
-                    break
-
-                target_row += 1
-
-        return merge_events
-
-    def _move_down(self, grid: MemoryGrid) -> List[MergeEvent]:
-        """Move all tiles down and merge"""
         merge_events = []
+        moved = False
+        for source, target, absorbed in plan:
+            tile = line[source]
+            if absorbed:
+                merge_events.append(self._merge_tiles(grid, index[cells[target]], tile, now))
+                moved = True
+            elif source != target:
+                occupancy.move(tile, cells[target])
+                moved = True
 
-        for col in range(grid.size):
-            col_tiles = sorted(
-                [t for t in grid.tiles if t.position[1] == col],
-                key=lambda t: t.position[0],
-                reverse=True
-            )
-
-            target_row = grid.size - 1
-            merged_this_move = set()
-
-            for tile in col_tiles:
-                while target_row > tile.position[0]:
-                    existing = self._get_tile_at(grid, target_row, col)
-
-                    if existing is None:
-                        tile.position = (target_row, col)
-                        break
-                    elif (existing.value == tile.value and
-                          existing.id not in merged_this_move and
-                          tile.id not in merged_this_move):
-                        merge_event = self._merge_tiles(grid, existing, tile)
-                        merge_events.append(merge_event)
-                        merged_this_move.add(existing.id)
-                        break
-                    else:
-                        target_row -= 1
-
-                if target_row < 0:
-                    break
-
-                target_row -= 1
-
-        return merge_events
+        return merge_events, moved
 
     def _get_tile_at(
         self,
@@ -371,16 +292,14 @@ class MemoryEngine:
         col: int
     ) -> Optional[MemoryTile]:
         """Get tile at specific position"""
-        for tile in grid.tiles:
-            if tile.position == (row, col):
-                return tile
-        return None
+        return grid._occupancy.at.get((row, col))
 
     def _merge_tiles(
         self,
         grid: MemoryGrid,
         tile1: MemoryTile,
-        tile2: MemoryTile
+        tile2: MemoryTile,
+        now: datetime
     ) -> MergeEvent:
         """Merge two tiles into one"""
         new_value = tile1.value + tile2.value
@@ -389,12 +308,13 @@ class MemoryEngine:
         # Update tile1 with merged values
         tile1.value = new_value
         tile1.concept = new_concept
-        tile1.last_merged = datetime.utcnow()
+        tile1.last_merged = now
         tile1.merge_count += 1
         tile1.source_concepts.extend([tile2.concept] + tile2.source_concepts)
 
-        # Remove tile2 from grid
-        grid.tiles = [t for t in grid.tiles if t.id != tile2.id]
+        # Remove tile2 from grid; the tiles list itself is compacted once at
+        # the end of the move
+        grid._occupancy.remove(tile2)
 
         # Update score
         grid.score += new_value
@@ -405,7 +325,7 @@ class MemoryEngine:
 
         # Create merge event
         event = MergeEvent(
-            id=str(uuid.uuid4()),
+            id=secrets.token_hex(8),
             user_id=grid.user_id,
             domain=grid.domain,
             tile1_concept=tile1.concept,
@@ -415,29 +335,28 @@ class MemoryEngine:
             result_concept=new_concept,
             result_value=new_value,
             position=tile1.position,
+            timestamp=now,
             insight=generate_merge_insight(tile1, tile2, tile1),
         )
 
-        self.merge_history.append(event)
+        self.store.append_merge(event)
         return event
 
     def _has_valid_moves(self, grid: MemoryGrid) -> bool:
         """Check if any valid moves remain"""
+        occupancy = grid._occupancy
+        index = occupancy.at
+
         # If there are empty cells, moves are possible
-        if grid.empty_cells:
+        if occupancy.free:
             return True
 
-        # Check for possible merges
-        for tile in grid.tiles:
-            row, col = tile.position
-
-            # Check adjacent tiles for possible merges
-            for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                adj_row, adj_col = row + dr, col + dc
-                if 0 <= adj_row < grid.size and 0 <= adj_col < grid.size:
-                    adj_tile = self._get_tile_at(grid, adj_row, adj_col)
-                    if adj_tile and adj_tile.value == tile.value:
-                        return True
+        # Check for possible merges; looking right and down covers every adjacent pair once
+        for (row, col), tile in index.items():
+            for neighbour in ((row, col + 1), (row + 1, col)):
+                adj_tile = index.get(neighbour)
+                if adj_tile is not None and adj_tile.value == tile.value:
+                    return True
 
         return False
 
@@ -460,10 +379,10 @@ class MemoryEngine:
                 tiles=[],
                 score=0,
             )
-            self.grids[user_id][domain] = grid
 
         # Add the new knowledge tile
         tile = self._add_random_tile(grid, concept=concept, value=value)
+        self.store.put_grid(grid)
 
         return grid, tile
 
@@ -471,11 +390,13 @@ class MemoryEngine:
         self,
         user_id: str,
         grid: MemoryGrid,
-        merge_events: List[MergeEvent]
+        merge_events: List[MergeEvent],
+        now: Optional[datetime] = None
     ):
         """Update user statistics"""
-        if user_id not in self.stats:
-            self.stats[user_id] = MemoryStats(
+        stats = self.store.get_stats(user_id)
+        if stats is None:
+            stats = MemoryStats(
                 user_id=user_id,
                 total_domains=0,
                 total_tiles=0,
@@ -484,9 +405,8 @@ class MemoryEngine:
                 total_merges=0,
             )
 
-        stats = self.stats[user_id]
         stats.total_merges += len(merge_events)
-        stats.last_learned = datetime.utcnow()
+        stats.last_learned = now or datetime.utcnow()
 
         if grid.highest_tile > stats.highest_tile_ever:
             stats.highest_tile_ever = grid.highest_tile
@@ -495,9 +415,12 @@ class MemoryEngine:
         if grid.won and grid.domain not in stats.domains_with_2048:
             stats.domains_with_2048.append(grid.domain)
 
+        self.store.put_stats(stats)
+
     def get_stats(self, user_id: str) -> MemoryStats:
         """Get user's memory statistics"""
-        if user_id not in self.stats:
+        stats = self.store.get_stats(user_id)
+        if stats is None:
             return MemoryStats(
                 user_id=user_id,
                 total_domains=0,
@@ -507,63 +430,55 @@ class MemoryEngine:
                 total_merges=0,
             )
 
-        stats = self.stats[user_id]
-
-        # Calculate totals across all domains
-        if user_id in self.grids:
-            stats.total_domains = len(self.grids[user_id])
-            stats.total_tiles = sum(
-                len(grid.tiles) for grid in self.grids[user_id].values()
-            )
-            stats.total_score = sum(
-                grid.score for grid in self.grids[user_id].values()
-            )
-
-            # Find strongest and weakest domains
-            if self.grids[user_id]:
-                domain_scores = {
-                    domain: grid.highest_tile
-                    for domain, grid in self.grids[user_id].items()
-                }
-                stats.strongest_domain = max(domain_scores, key=domain_scores.get)
-                stats.weakest_domain = min(domain_scores, key=domain_scores.get)
+        # Calculate totals across all domains, and the strongest and weakest
+        # domains by highest tile (first one wins a tie), in one pass
+        user_grids = self.store.get_grids(user_id)
+        total_tiles = 0
+        total_score = 0
+        strongest = weakest = None
+        best = worst = 0
+        for domain, grid in user_grids.items():
+            total_tiles += len(grid.tiles)
+            total_score += grid.score
+            if strongest is None or grid.highest_tile > best:
+                strongest, best = domain, grid.highest_tile
+            if weakest is None or grid.highest_tile < worst:
+                weakest, worst = domain, grid.highest_tile
+
+        stats.total_domains = len(user_grids)
+        stats.total_tiles = total_tiles
+        stats.total_score = total_score
+        if user_grids:
+            stats.strongest_domain = strongest
+            stats.weakest_domain = weakest
 
         return stats
 
     def get_all_grids(self, user_id: str) -> Dict[KnowledgeDomain, MemoryGrid]:
         """Get all grids for a user"""
-        return self.grids.get(user_id, {})
+        return self.store.get_grids(user_id)
 
     def reset_grid(self, user_id: str, domain: KnowledgeDomain) -> MemoryGrid:
         """Reset a specific grid"""
-        if user_id in self.grids and domain in self.grids[user_id]:
-            del self.grids[user_id][domain]
+        self.store.delete_grid(user_id, domain)
         return self.get_or_create_grid(user_id, domain)
 
     def render_grid_ascii(self, grid: MemoryGrid) -> str:
         """Render the grid as ASCII art"""
-        grid_array = grid.grid_array
-        cell_width = 8
-
-        lines = []
-        lines.append("┌" + ("─" * cell_width + "┬") * (grid.size - 1) + "─" * cell_width + "┐")
-
-        for row_idx, row in enumerate(grid_array):
-            row_str = "│"
-            for tile in row:
-                if tile:
-                    val_str = str(tile.value).center(cell_width)
-                else:
-                    val_str = " " * cell_width
-                row_str += val_str + "│"
-            lines.append(row_str)
-
-            if row_idx < grid.size - 1:
-                lines.append("├" + ("─" * cell_width + "┼") * (grid.size - 1) + "─" * cell_width + "┤")
-
-        lines.append("└" + ("─" * cell_width + "┴") * (grid.size - 1) + "─" * cell_width + "┘")
-
-        return "\n".join(lines)
+        size = grid.size
+        top, separator, bottom = _grid_borders(size, ASCII_CELL_WIDTH)
+        blank = " " * ASCII_CELL_WIDTH
+        at = grid._occupancy.at
+
+        rows = []
+        for row in range(size):
+            cells = []
+            for col in range(size):
+                tile = at.get((row, col))
+                cells.append(str(tile.value).center(ASCII_CELL_WIDTH) if tile else blank)
+            rows.append("│" + "│".join(cells) + "│")
+
+        return "\n".join((top, f"\n{separator}\n".join(rows), bottom))
 
 
 # Create singleton instance
@@ -0,0 +1,75 @@
+"""
+Lucidia Memory Store - persistence seam for the memory engine
+
+The engine reads and writes grids, stats, and merge events only through a
+MemoryStore, so swapping the in-process dicts for a database doesn't touch
+game logic. InProcessStore keeps plain dicts, the engine's original behaviour.
+"""
+
+from collections import deque
+from typing import Deque, Dict, Optional, Protocol
+
+from models.memory import KnowledgeDomain, MemoryGrid, MemoryStats, MergeEvent
+
+# Merge events kept across all users
+MERGE_HISTORY_SIZE = 10_000
+
+
+class MemoryStore(Protocol):
+    """
+    Storage used by MemoryEngine. The engine mutates grids and stats in place
+    and then hands them back with put_grid / put_stats, which is the store's
+    cue that they changed.
+    """
+
+    def get_grids(self, user_id: str) -> Dict[KnowledgeDomain, MemoryGrid]:
+        """All of a user's grids by domain (empty if none); treat as read-only"""
+        ...
+
+    def put_grid(self, grid: MemoryGrid) -> None:
+        """Store a new or changed grid"""
+        ...
+
+    def delete_grid(self, user_id: str, domain: KnowledgeDomain) -> None:
+        """Remove a user's grid for a domain, if any"""
+        ...
+
+    def get_stats(self, user_id: str) -> Optional[MemoryStats]:
+        """The user's stats, or None if nothing has been recorded yet"""
+        ...
+
+    def put_stats(self, stats: MemoryStats) -> None:
+        """Store new or changed stats"""
+        ...
+
+    def append_merge(self, event: MergeEvent) -> None:
+        """Record a merge event"""
+        ...
+
+
+class InProcessStore:
+    """Keeps everything in process memory; nothing survives a restart"""
+
+    def __init__(self):
+        self.grids: Dict[str, Dict[KnowledgeDomain, MemoryGrid]] = {}
+        self.stats: Dict[str, MemoryStats] = {}
+        # Most recent merges; older events fall off the end
+        self.merge_history: Deque[MergeEvent] = deque(maxlen=MERGE_HISTORY_SIZE)
+
+    def get_grids(self, user_id: str) -> Dict[KnowledgeDomain, MemoryGrid]:
+        return self.grids.get(user_id, {})
+
+    def put_grid(self, grid: MemoryGrid) -> None:
+        self.grids.setdefault(grid.user_id, {})[grid.domain] = grid
+
+    def delete_grid(self, user_id: str, domain: KnowledgeDomain) -> None:
+        self.grids.get(user_id, {}).pop(domain, None)
+
+    def get_stats(self, user_id: str) -> Optional[MemoryStats]:
+        return self.stats.get(user_id)
+
+    def put_stats(self, stats: MemoryStats) -> None:
+        self.stats[stats.user_id] = stats
+
+    def append_merge(self, event: MergeEvent) -> None:
+        self.merge_history.append(event)